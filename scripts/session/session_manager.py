@@ -420,7 +420,7 @@ def copy_task_to_session(task_id: str, task_content: str) -> Path:
         Path: Path to created task.md file
 
     Raises:
-        ValueError: If task_id doesn't match pattern TASK-\\d{3}
+        ValueError: If task_id doesn't match pattern TASK-\\d+
         RuntimeError: If no active session for current terminal
 
     Example:
@@ -429,7 +429,7 @@ def copy_task_to_session(task_id: str, task_content: str) -> Path:
         Path('.agent/Session-feature-auth/Task-015--implement-auth/task.md')
     """
     # Validate task_id format
-    if not re.match(r"^TASK-\d{3}$", task_id):
+    if not re.match(r"^TASK-\d+$", task_id):
         raise ValueError(f"Invalid task_id '{task_id}'. Must match TASK-XXX pattern (e.g., TASK-015)")
 
     session_name = get_session_for_terminal()
@@ -437,7 +437,7 @@ def copy_task_to_session(task_id: str, task_content: str) -> Path:
         raise RuntimeError("No active session for current terminal")
 
     # Extract task title from content (T039)
-    title_match = re.search(r"^##\s+\[TASK-\d{3}\]\s+(.+)$", task_content, re.MULTILINE)
+    title_match = re.search(r"^##\s+\[TASK-\d+\]\s+(.+)$", task_content, re.MULTILINE)
     task_title = title_match.group(1) if title_match else "untitled"
 
     # Create task directory (T040)
@@ -581,7 +581,7 @@ def get_task_dir(session_name: str, task_id: str, task_title: str) -> Path:
         Path('.agent/Session-feature-auth/Task-015--implement-authentication')
     """
     # Validate task_id format
-    if not re.match(r"^TASK-\d{3}$", task_id):
+    if not re.match(r"^TASK-\d+$", task_id):
         raise ValueError(f"Invalid task_id format: {task_id}. Must match TASK-XXX pattern.")
 
     # Get session directory
@@ -934,7 +934,7 @@ def setup_task_atomic(task_id: str, task_content: str) -> Dict[str, Any]:
     All operations succeed or all fail together (rollback on error).
 
     Args:
-        task_id: Task ID matching pattern TASK-\\d{3}
+        task_id: Task ID matching pattern TASK-\\d+
         task_content: Full task markdown content
 
     Returns:
@@ -955,7 +955,7 @@ def setup_task_atomic(task_id: str, task_content: str) -> Dict[str, Any]:
         RuntimeError: If no active session
     """
     # Validate task_id format
-    if not re.match(r"^TASK-\d{3}$", task_id):
+    if not re.match(r"^TASK-\d+$", task_id):
         raise ValueError(f"Invalid task_id '{task_id}'. Must match TASK-XXX pattern (e.g., TASK-001)")
 
     # Get active session
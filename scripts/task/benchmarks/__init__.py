@@ -0,0 +1,16 @@
+"""Benchmark suite for the task parsing stack.
+
+Usage (from scripts/task):
+    python -m benchmarks.generate 10000 /tmp/tasks.md
+    python -m benchmarks.run --sizes=1000,10000 --save=baseline.json
+    python -m benchmarks.run --sizes=1000,10000 --compare=baseline.json
+"""
+
+from pathlib import Path
+import sys
+
+
+# Task scripts import each other as top-level modules (e.g. `from markdown_parser import ...`)
+TASK_SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(TASK_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TASK_SCRIPTS_DIR))
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+"""
+Deterministic synthetic tasks.md generator
+
+Produces task files in the ## [TASK-XXX] schema with realistic shape:
+- Epics shared by groups of tasks
+- Dependency graphs pointing mostly at recent earlier tasks, with occasional
+  orphaned references and completed blockers
+- Skewed status/priority/category distributions
+- Description lengths ranging from one line to several paragraphs
+
+Same (count, seed) always yields byte-identical output.
+"""
+
+from pathlib import Path
+import random
+import sys
+from typing import List
+
+
+EPICS = [
+    "Auth System",
+    "Template Standardization",
+    "Context Management",
+    "Skills System",
+    "Best Practices",
+    "Performance",
+    "Documentation",
+    "Git Workflow",
+]
+STATUSES = ["pending"] * 6 + ["in-progress"] * 2 + ["blocked", "completed", "completed", "completed"]
+PRIORITIES = ["low"] * 2 + ["medium"] * 5 + ["high"] * 2 + ["critical"]
+CATEGORIES = ["feature", "bug", "refactor", "docs", "chore", "research"]
+VERBS = ["Add", "Fix", "Refactor", "Document", "Optimize", "Validate", "Migrate", "Remove", "Research", "Align"]
+NOUNS = [
+    "auth",
+    "token",
+    "session",
+    "cache",
+    "index",
+    "parser",
+    "agent",
+    "template",
+    "hook",
+    "command",
+    "archive",
+    "search",
+    "query",
+    "status-line",
+    "workflow",
+    "context",
+    "skill",
+    "epic",
+    "dependency",
+    "schema",
+    "validation",
+    "sanitizer",
+    "config",
+    "logger",
+    "registry",
+    "worktree",
+    "branch",
+    "release",
+    "changelog",
+    "mcp",
+]
+FILLER = [
+    "the",
+    "and",
+    "for",
+    "with",
+    "when",
+    "across",
+    "before",
+    "after",
+    "into",
+    "without",
+    "handle",
+    "ensure",
+    "support",
+    "update",
+    "improve",
+    "review",
+    "check",
+    "align",
+    "prevent",
+    "track",
+]
+
+
+def _title(rng: random.Random) -> str:
+    words = rng.sample(NOUNS, rng.randint(2, 4))
+    return f"{rng.choice(VERBS)} {' '.join(words)}"
+
+
+def _description(rng: random.Random) -> str:
+    # Mostly short, long tail of multi-paragraph descriptions
+    paragraphs = 1 if rng.random() < 0.8 else rng.randint(2, 4)
+    chunks = []
+    for _ in range(paragraphs):
+        length = int(rng.lognormvariate(3.0, 0.8)) + 5
+        chunks.append(" ".join(rng.choice(NOUNS + FILLER) for _ in range(length)).capitalize() + ".")
+    return "\n\n".join(chunks)
+
+
+def _depends_on(rng: random.Random, index: int) -> List[str]:
+    if index == 0 or rng.random() < 0.55:
+        return []
+
+    deps = set()
+    for _ in range(rng.randint(1, 3)):
+        if rng.random() < 0.02:
+            deps.add(index + rng.randint(1, 1000))  # orphaned / forward reference
+        else:
+            deps.add(max(0, index - 1 - int(rng.expovariate(1 / 20))))
+    return [f"TASK-{dep + 1:03d}" for dep in sorted(deps)]
+
+
+def generate_task(rng: random.Random, index: int) -> str:
+    """Generate one task section (header through --- separator)."""
+    task_id = f"TASK-{index + 1:03d}"
+    epic_line = f"**Epic**: {rng.choice(EPICS)}\n" if rng.random() < 0.7 else ""
+    depends = _depends_on(rng, index)
+    related = f"TASK-{rng.randint(1, index + 1):03d}" if rng.random() < 0.3 else "(none)"
+
+    return (
+        f"## [{task_id}] {_title(rng)}\n\n"
+        f"**Status**: {rng.choice(STATUSES)}\n"
+        f"**Priority**: {rng.choice(PRIORITIES)}\n"
+        f"**Category**: {rng.choice(CATEGORIES)}\n"
+        f"{epic_line}"
+        f"**Depends On**: {', '.join(depends) if depends else '(none)'}\n"
+        f"**Related**: {related}\n"
+        f"**Origin**: adhoc\n"
+        f"**Created**: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00Z\n\n"
+        f"**Description**:\n{_description(rng)}\n\n"
+        f"---\n\n"
+    )
+
+
+def generate_tasks_markdown(count: int, seed: int = 0) -> str:
+    """
+    Generate a complete tasks.md document.
+
+    Args:
+        count: Number of tasks
+        seed: Random seed (same seed → identical output)
+
+    Returns:
+        Markdown content
+    """
+    rng = random.Random(seed)
+    parts = ["# Active Tasks\n\n"]
+    parts.extend(generate_task(rng, index) for index in range(count))
+    return "".join(parts)
+
+
+def write_tasks_file(path: Path, count: int, seed: int = 0) -> Path:
+    """Generate a tasks file at path and return it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate_tasks_markdown(count, seed))
+    return path
+
+
+def main() -> None:
+    """CLI interface for the generator."""
+    if len(sys.argv) < 3:
+        print("Usage: python -m benchmarks.generate <count> <output-file> [--seed=0]")
+        sys.exit(1)
+
+    count = int(sys.argv[1])
+    output = Path(sys.argv[2])
+    seed = 0
+
+    for arg in sys.argv[3:]:
+        if arg.startswith("--seed="):
+            seed = int(arg.split("=")[1])
+
+    write_tasks_file(output, count, seed)
+    print(f"Wrote {count} tasks to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+"""
+Benchmark runner for the task parsing stack
+
+Generates deterministic tasks.md files (see benchmarks.generate) and measures,
+per function and file size:
+- wall time (best of N repeats, perf_counter)
+- peak traced memory (tracemalloc, separate run so tracing doesn't skew timing)
+- throughput (tasks or lookups per second)
+
+Relevance ranking and TaskMatcher similarity are measured on both the
+pure-Python and the NumPy backend (reported as an error when NumPy is missing).
+
+Results can be saved as a JSON baseline and compared against later runs to
+catch regressions across commits.
+"""
+
+from datetime import datetime
+import json
+from pathlib import Path
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import TaskSearchConfig
+from markdown_parser import parse_task_blocks
+from sanitize_dependencies import DependencySanitizer
+from task_analyzer import TaskAnalyzer, load_tasks_from_file
+from task_cache import get_cache_dir
+from task_index import INDEX_LOADERS
+from task_schema_manager import extract_task_section
+from task_search import load_tasks, rank_loaded_tasks
+from task_vectors import HAVE_NUMPY
+
+from benchmarks.generate import write_tasks_file
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEATS = 3
+DEFAULT_TOLERANCE = 0.2  # 20% slower than baseline counts as a regression
+SECTION_LOOKUPS = 100
+RANKING_QUERIES = ["cache", "fix session token", "validation errors", "refactor the parser"]
+
+# (name, setup, run) - setup is untimed; run returns the number of items processed
+BenchmarkCase = Tuple[str, Callable[[], None], Callable[[], int]]
+
+
+def _no_setup() -> None:
+    return None
+
+
+def _backend(vectorized: bool, run: Callable[[], int]) -> Callable[[], int]:
+    """Wrap run so it executes on the NumPy (vectorized=True) or pure-Python backend."""
+
+    def run_on_backend() -> int:
+        if vectorized and not HAVE_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+
+        threshold = TaskSearchConfig.VECTOR_MIN_TASKS
+        TaskSearchConfig.VECTOR_MIN_TASKS = 0 if vectorized else sys.maxsize
+        try:
+            return run()
+        finally:
+            TaskSearchConfig.VECTOR_MIN_TASKS = threshold
+
+    return run_on_backend
+
+
+def build_cases(tasks_file: Path) -> List[BenchmarkCase]:
+    """Build the benchmark cases for one generated tasks file."""
+    content = tasks_file.read_text()
+    task_ids = [task_id for task_id, _ in parse_task_blocks(content)]
+    lookup_ids = random.Random(0).sample(task_ids, min(SECTION_LOOKUPS, len(task_ids)))
+
+    def clear_cache() -> None:
+        shutil.rmtree(get_cache_dir(tasks_file), ignore_errors=True)
+
+    def warm_cache() -> None:
+        load_tasks(tasks_file)
+        extract_task_section(tasks_file, lookup_ids[0])
+
+    def extract_sections() -> int:
+        for task_id in lookup_ids:
+            extract_task_section(tasks_file, task_id)
+        return len(lookup_ids)
+
+    def sanitize() -> int:
+        sanitizer = DependencySanitizer(tasks_file)
+        sanitizer.sanitize()
+        return len(sanitizer.tasks)
+
+    # Ranking cases run against warm in-memory tasks and indexes, as in the daemon
+    warm: Dict = {"indexes": {}}
+
+    def load_index(kind: str) -> Dict:
+        if kind not in warm["indexes"]:
+            warm["indexes"][kind] = INDEX_LOADERS[kind](tasks_file, warm["tasks"], None)
+        return warm["indexes"][kind]
+
+    def warm_ranking() -> None:
+        if "tasks" not in warm:
+            warm["tasks"] = load_tasks(tasks_file)
+            warm["analyzer"] = TaskAnalyzer(warm["tasks"])
+            warm["keywords"] = [warm["analyzer"]._extract_keywords(query) for query in RANKING_QUERIES]
+        for vectorized in (False, True):
+            if HAVE_NUMPY or not vectorized:
+                _backend(vectorized, rank_queries)()
+                _backend(vectorized, match_keywords)()
+
+    def rank_queries() -> int:
+        for query in RANKING_QUERIES:
+            rank_loaded_tasks(warm["tasks"], load_index, query, limit=0, include_completed=True)
+        return len(RANKING_QUERIES)
+
+    def match_keywords() -> int:
+        for keywords in warm["keywords"]:
+            warm["analyzer"].matcher.find_matches(keywords)
+        return len(RANKING_QUERIES)
+
+    return [
+        ("parse_task_blocks", _no_setup, lambda: len(parse_task_blocks(content))),
+        ("load_tasks (cold)", clear_cache, lambda: len(load_tasks(tasks_file))),
+        ("load_tasks (warm)", warm_cache, lambda: len(load_tasks(tasks_file))),
+        ("load_tasks_from_file (warm)", warm_cache, lambda: len(load_tasks_from_file(tasks_file))),
+        ("extract_task_section (cold)", clear_cache, extract_sections),
+        ("extract_task_section (warm)", warm_cache, extract_sections),
+        ("DependencySanitizer (warm)", warm_cache, sanitize),
+        ("rank_relevance (python)", warm_ranking, _backend(False, rank_queries)),
+        ("rank_relevance (numpy)", warm_ranking, _backend(True, rank_queries)),
+        ("find_matches (python)", warm_ranking, _backend(False, match_keywords)),
+        ("find_matches (numpy)", warm_ranking, _backend(True, match_keywords)),
+    ]
+
+
+def measure(setup: Callable[[], None], run: Callable[[], int], repeats: int) -> Dict:
+    """
+    Measure one benchmark case.
+
+    Returns:
+        Dict with wall_seconds, peak_memory_bytes, items and
+        throughput_per_second (or error if the case raised)
+    """
+    try:
+        timings = []
+        items = 0
+        for _ in range(repeats):
+            setup()
+            started = time.perf_counter()
+            items = run()
+            timings.append(time.perf_counter() - started)
+
+        setup()
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    wall = min(timings)
+    return {
+        "wall_seconds": wall,
+        "peak_memory_bytes": peak,
+        "items": items,
+        "throughput_per_second": items / wall if wall > 0 else None,
+    }
+
+
+def run_benchmarks(sizes: List[int], repeats: int = DEFAULT_REPEATS, seed: int = 0) -> Dict:
+    """
+    Run every benchmark case for each file size.
+
+    Args:
+        sizes: Task counts to generate (e.g., [1000, 10000])
+        repeats: Timed repetitions per case (best is reported)
+        seed: Generator seed
+
+    Returns:
+        Dict of {"meta": {...}, "results": {size: {case: measurement}}}
+    """
+    results: Dict[str, Dict[str, Dict]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="task-bench-") as work_dir:
+        for size in sizes:
+            tasks_file = write_tasks_file(Path(work_dir) / f"tasks-{size}" / "tasks.md", size, seed)
+            results[str(size)] = {}
+            for name, setup, run in build_cases(tasks_file):
+                results[str(size)][name] = measure(setup, run, repeats)
+                print(format_row(size, name, results[str(size)][name]), file=sys.stderr)
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def format_row(size: int, name: str, measurement: Dict) -> str:
+    """Format one measurement as a fixed-width report line."""
+    if "error" in measurement:
+        return f"{size:>7} | {name:<28} | {measurement['error']}"
+
+    return (
+        f"{size:>7} | {name:<28} | {measurement['wall_seconds'] * 1000:>10.2f} ms | "
+        f"{measurement['peak_memory_bytes'] / 1024 / 1024:>8.2f} MiB | "
+        f"{measurement['throughput_per_second'] or 0:>12.0f} items/s"
+    )
+
+
+def compare_results(current: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[Dict]:
+    """
+    Compare wall times against a baseline run.
+
+    Args:
+        current: Results from run_benchmarks
+        baseline: Previously saved results
+        tolerance: Allowed slowdown before flagging (0.2 = 20%)
+
+    Returns:
+        One entry per (size, case) present in both runs
+    """
+    comparisons = []
+    for size, cases in current["results"].items():
+        for name, measurement in cases.items():
+            base = baseline.get("results", {}).get(size, {}).get(name)
+            if not base or not base.get("wall_seconds") or "wall_seconds" not in measurement:
+                continue
+
+            ratio = measurement["wall_seconds"] / base["wall_seconds"]
+            comparisons.append(
+                {
+                    "size": size,
+                    "case": name,
+                    "baseline_seconds": base["wall_seconds"],
+                    "current_seconds": measurement["wall_seconds"],
+                    "ratio": round(ratio, 3),
+                    "regression": ratio > 1 + tolerance,
+                }
+            )
+    return comparisons
+
+
+def main() -> None:
+    """CLI interface for the benchmark runner."""
+    sizes = DEFAULT_SIZES
+    repeats = DEFAULT_REPEATS
+    save_path: Optional[Path] = None
+    compare_path: Optional[Path] = None
+    tolerance = DEFAULT_TOLERANCE
+
+    for arg in sys.argv[1:]:
+        if arg.startswith("--sizes="):
+            sizes = [int(s) for s in arg.split("=", 1)[1].split(",") if s]
+        elif arg.startswith("--repeats="):
+            repeats = int(arg.split("=", 1)[1])
+        elif arg.startswith("--save="):
+            save_path = Path(arg.split("=", 1)[1])
+        elif arg.startswith("--compare="):
+            compare_path = Path(arg.split("=", 1)[1])
+        elif arg.startswith("--tolerance="):
+            tolerance = float(arg.split("=", 1)[1])
+        else:
+            print(
+                "Usage: python -m benchmarks.run [--sizes=1000,10000,100000] [--repeats=3] "
+                "[--save=baseline.json] [--compare=baseline.json] [--tolerance=0.2]"
+            )
+            sys.exit(1)
+
+    current = run_benchmarks(sizes, repeats)
+    output: Dict = {"run": current}
+
+    if save_path:
+        save_path.write_text(json.dumps(current, indent=2))
+
+    regressions = []
+    if compare_path:
+        comparisons = compare_results(current, json.loads(compare_path.read_text()), tolerance)
+        regressions = [c for c in comparisons if c["regression"]]
+        output["comparison"] = comparisons
+        output["regressions"] = len(regressions)
+
+    print(json.dumps(output, indent=2))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,14 @@ class TaskAnalyzerConfig:
     SIMILARITY_THRESHOLD = 0.2  # Minimum similarity to include in results
     TOP_N_MATCHES = 5  # Number of top task matches to return
 
+    # Duplicate Detection Parameters (task_analyzer duplicates)
+    DUPLICATE_THRESHOLD = 0.8  # Minimum keyword Jaccard similarity for two tasks to be reported as duplicates
+    MINHASH_SIGNATURE_SIZE = 64  # MinHash positions per task (split into LSH bands)
+    LSH_TARGET_RECALL = 0.99  # Chance a pair exactly at the threshold is compared; bands/rows derive from it
+    LSH_BUCKET_LIMIT = 32  # Larger buckets compare only signature-sorted neighbours (bounds work per bucket)
+    LSH_NEIGHBOURS = 4  # Neighbours compared per task in an oversized bucket
+    MAX_REPORTED_PAIRS = 20  # Verified pairs listed per cluster (pair_count has the total)
+
     # Epic Detection Parameters
     EXPLICIT_EPIC_CONFIDENCE = 0.95  # Confidence when epic explicitly mentioned
     TASK_MATCH_EPIC_BOOST = 0.6  # Multiplier for task match contribution to epic
@@ -34,3 +42,31 @@ class TaskAnalyzerConfig:
     CONFIDENCE_EXPLICIT_PRIORITY = 0.99  # Explicit priority marker ([BLOCKER])
     CONFIDENCE_DEFAULT_PRIORITY = 0.60  # Priority inferred or default
     CONFIDENCE_CATEGORY = 0.65  # Category confidence (often inferred)
+
+
+class TaskSearchConfig:
+    """Configuration for task search ranking."""
+
+    # BM25 Parameters (task_search --rank=bm25)
+    BM25_K1 = 1.2  # Term frequency saturation
+    BM25_B = 0.75  # Strength of field length normalization (0 = none, 1 = full)
+    BM25_TITLE_WEIGHT = 2.0  # Weight of title matches
+    BM25_DESCRIPTION_WEIGHT = 1.0  # Weight of description matches
+
+    # Fuzzy Search Parameters (task_search --fuzzy)
+    FUZZY_MAX_DISTANCE = 2  # Maximum edit distance allowed for any query word
+    FUZZY_CHARS_PER_EDIT = 3  # One extra allowed edit per this many characters (3 chars → exact only)
+
+    # NumPy Backend (used only when numpy is importable; rankings are identical either way)
+    VECTOR_MIN_TASKS = 5000  # Smallest backlog scored with vectorized relevance/similarity
+
+    # Autocomplete (task_search complete)
+    COMPLETE_SCAN_LIMIT = 250  # Index entries examined per completion (~1 ms worst case for unselective input)
+
+    # Result Cache (task_search search)
+    RESULT_CACHE_SIZE = 32  # Searches remembered per tasks file (0 disables the cache)
+    RESULT_CACHE_TTL_SECONDS = 3600  # Maximum age of a cached result (0 = until tasks.md changes)
+
+    # Pagination (task_search search --page-size / --cursor)
+    PAGE_CACHE_SIZE = 8  # Full rankings kept for cursors per tasks file
+    PAGE_CURSOR_TTL_SECONDS = 3600  # Cursors older than this must restart from the first page
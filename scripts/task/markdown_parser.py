@@ -5,8 +5,80 @@ Provides utilities for parsing and extracting task metadata from markdown format
 Single source of truth for markdown parsing logic to prevent duplication.
 """
 
+import mmap
+from pathlib import Path
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# Task header: ## [TASK-XXX] Title
+TASK_HEADER_REGEX = r"^##\s+\[(TASK-\d+)\]\s+(.+?)$"
+TASK_HEADER_PATTERN = re.compile(TASK_HEADER_REGEX, re.MULTILINE)
+TASK_HEADER_BYTES_PATTERN = re.compile(TASK_HEADER_REGEX.encode("ascii"), re.MULTILINE)
+
+
+def _iter_block_spans(pattern: "re.Pattern", data: Union[str, bytes, mmap.mmap]) -> Iterator[Tuple[Any, int, int]]:
+    """Yield (task_id, start, end) for each task block found by one finditer pass."""
+    previous = None
+    for match in pattern.finditer(data):
+        if previous is not None:
+            yield previous.group(1), previous.start(), match.start()
+        previous = match
+
+    if previous is not None:
+        yield previous.group(1), previous.start(), len(data)
+
+
+def iter_task_blocks(content: str) -> Iterator[Tuple[str, str, int, int]]:
+    """Scan markdown content once and yield every task block.
+
+    Headers are located with a single finditer pass; each block runs from its
+    header up to the next header (or end of content), so no slice of the file
+    is copied more than once.
+
+    Args:
+        content: Full markdown file content
+
+    Yields:
+        (task_id, task_block, start_offset, end_offset) tuples, where
+        task_block == content[start_offset:end_offset] and starts with the
+        task header line
+
+    Raises:
+        ValueError: If content is not a string
+    """
+    if not isinstance(content, str):
+        raise ValueError(f"Expected string content, got {type(content).__name__}")
+
+    for task_id, start_pos, end_pos in _iter_block_spans(TASK_HEADER_PATTERN, content):
+        yield task_id, content[start_pos:end_pos], start_pos, end_pos
+
+
+def iter_task_file(tasks_file: Path) -> Iterator[Tuple[str, str, int, int]]:
+    """Stream task blocks from a file without reading it into memory.
+
+    The file is memory-mapped and scanned lazily, so only the block currently
+    being yielded is decoded. Memory use stays constant regardless of file
+    size (e.g., an ever-growing tasks-archive.md).
+
+    Args:
+        tasks_file: Path to tasks markdown file
+
+    Yields:
+        (task_id, task_block, start_offset, end_offset) tuples with byte offsets
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    with tasks_file.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for task_id, start_pos, end_pos in _iter_block_spans(TASK_HEADER_BYTES_PATTERN, mapped):
+                task_block = mapped[start_pos:end_pos].decode("utf-8").replace("\r\n", "\n")
+                yield task_id.decode("ascii"), task_block, start_pos, end_pos
 
 
 def parse_task_blocks(content: str) -> List[Tuple[str, str]]:
@@ -21,28 +93,127 @@ def parse_task_blocks(content: str) -> List[Tuple[str, str]]:
     Raises:
         ValueError: If content is not a string
     """
-    # Input validation
-    if not isinstance(content, str):
-        raise ValueError(f"Expected string content, got {type(content).__name__}")
+    return [(task_id, task_block) for task_id, task_block, _, _ in iter_task_blocks(content)]
+
+
+def parse_task_title(task_block: str) -> Optional[str]:
+    """Extract the title from the header line of a task block.
+
+    Args:
+        task_block: Task markdown block (as yielded by iter_task_blocks)
 
-    if not content:
-        return []
+    Returns:
+        Title text or None if the block does not start with a task header
+    """
+    match = TASK_HEADER_PATTERN.match(task_block)
+    return match.group(2).strip() if match else None
 
-    pattern = r"^##\s+\[TASK-(\d{3})\]\s+(.+?)$"
-    blocks = []
 
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        task_id = f"TASK-{match.group(1)}"
+# **Field**: value markers and the value shapes read at each marker (precompiled once)
+FIELD_MARKER_PATTERN = re.compile(r"\*\*([^*\n]+)\*\*:")
+WORD_VALUE_PATTERN = re.compile(r"\s*(\w[\w-]*)")  # hyphenated words such as "in-progress"
+TEXT_VALUE_PATTERN = re.compile(r"\s*(.+?)(?:\n|\*\*)")
+MULTILINE_VALUE_PATTERN = re.compile(r"\s*(.+?)(?=\n\n|\*\*|---)", re.DOTALL)
 
-        # Extract task block until next task
-        start_pos = match.end()
-        next_match = re.search(pattern, content[start_pos:])
-        end_pos = start_pos + next_match.start() if next_match else len(content)
-        task_block = content[start_pos:end_pos]
 
-        blocks.append((task_id, task_block))
+class TaskFields:
+    """Every **Field**: value marker in a task block, collected in one scan.
 
-    return blocks
+    A single C-level split of the block on field markers yields each field's
+    name and the text segment that follows it. Typed accessors then match a
+    precompiled value pattern against that short segment instead of
+    rescanning the whole block with a fresh regex per field.
+    """
+
+    __slots__ = ("block", "names", "segments", "positions")
+
+    def __init__(self, task_block: str) -> None:
+        parts = FIELD_MARKER_PATTERN.split(task_block)
+        self.block = task_block
+        self.names: List[str] = parts[1::2]
+        self.segments: List[str] = parts[2::2]
+        # First occurrence of each field name wins (as with re.search)
+        count = len(self.names)
+        self.positions: Dict[str, int] = dict(zip(reversed(self.names), range(count - 1, -1, -1)))
+
+    def _read_at(self, index: int, value_pattern: "re.Pattern") -> Optional[str]:
+        segment = self.segments[index]
+        is_last = index == len(self.segments) - 1
+
+        if value_pattern is MULTILINE_VALUE_PATTERN and (is_last or not segment.endswith("*")):
+            value = self._read_multiline(segment, is_last)
+            if value is not None:
+                return value
+            match = value_pattern.match(segment) if is_last else self._match_in_block(index, value_pattern)
+        elif value_pattern is WORD_VALUE_PATTERN or is_last:
+            # A word value can never run past the segment: the next marker starts with "**"
+            match = value_pattern.match(segment)
+        elif segment and not segment.isspace():
+            # The next "**Name**:" marker terminates every value shape, so "**" stands in for it
+            match = value_pattern.match(segment + "**")
+        else:
+            match = self._match_in_block(index, value_pattern)
+
+        return match.group(1).strip() if match else None
+
+    @staticmethod
+    def _read_multiline(segment: str, is_last: bool) -> Optional[str]:
+        """Fast path for MULTILINE_VALUE_PATTERN using str.find instead of a lazy regex scan.
+
+        Returns None when the regex would need to backtrack (blank value, or no
+        terminator before the end of the block) so the caller falls back to it.
+        """
+        start = len(segment) - len(segment.lstrip())
+        if start == len(segment):
+            return None
+
+        # Value ends at the first "\n\n", "**" or "---" after its first character, or at the next marker
+        end = -1 if is_last else len(segment)
+        for terminator in ("\n\n", "**", "---"):
+            position = segment.find(terminator, start + 1, len(segment) if end == -1 else end)
+            if position != -1:
+                end = position
+        return segment[start:end].strip() if end != -1 else None
+
+    def _match_in_block(self, index: int, value_pattern: "re.Pattern") -> Optional["re.Match"]:
+        """Match a value against the full block at a marker (for values that run into the next marker)."""
+        # Each marker is "**" + name + "**:", i.e. len(name) + 5 characters
+        tail = sum(len(name) + 5 + len(rest) for name, rest in zip(self.names[index:], self.segments[index:]))
+        return value_pattern.match(self.block, len(self.block) - tail + len(self.names[index]) + 5)
+
+    def _read(self, field_name: str, value_pattern: "re.Pattern") -> Optional[str]:
+        index = self.positions.get(field_name)
+        if index is None:
+            return None
+
+        value = self._read_at(index, value_pattern)
+        if value is not None or len(self.positions) == len(self.names):
+            return value
+
+        # First marker had no readable value: fall back to later occurrences, like re.search would
+        for later in range(index + 1, len(self.names)):
+            if self.names[later] == field_name:
+                value = self._read_at(later, value_pattern)
+                if value is not None:
+                    return value
+        return None
+
+    def field(self, field_name: str, multiline: bool = False) -> Optional[str]:
+        """Single-word value (or multi-line value if multiline), as extract_field."""
+        return self._read(field_name, MULTILINE_VALUE_PATTERN if multiline else WORD_VALUE_PATTERN)
+
+    def text(self, field_name: str) -> Optional[str]:
+        """Single-line text value, as extract_text_field."""
+        return self._read(field_name, TEXT_VALUE_PATTERN)
+
+    def depends_on(self) -> List[str]:
+        """Depends On value as a list of task IDs, as parse_depends_on."""
+        depends_text = self.text("Depends On")
+
+        if not depends_text or depends_text == "(none)":
+            return []
+
+        return [t.strip() for t in depends_text.split(",")]
 
 
 def extract_field(task_block: str, field_name: str, multiline: bool = False) -> Optional[str]:
@@ -56,14 +227,7 @@ def extract_field(task_block: str, field_name: str, multiline: bool = False) ->
     Returns:
         Field value or None if not found
     """
-    if multiline:
-        pattern = rf"\*\*{field_name}\*\*:\s*(.+?)(?=\n\n|\*\*|---)"
-        match = re.search(pattern, task_block, re.DOTALL)
-    else:
-        pattern = rf"\*\*{field_name}\*\*:\s*(\w+)"
-        match = re.search(pattern, task_block)
-
-    return match.group(1).strip() if match else None
+    return TaskFields(task_block).field(field_name, multiline)
 
 
 def extract_text_field(task_block: str, field_name: str) -> Optional[str]:
@@ -76,9 +240,7 @@ def extract_text_field(task_block: str, field_name: str) -> Optional[str]:
     Returns:
         Field value or None if not found
     """
-    pattern = rf"\*\*{field_name}\*\*:\s*(.+?)(?:\n|\*\*)"
-    match = re.search(pattern, task_block)
-    return match.group(1).strip() if match else None
+    return TaskFields(task_block).text(field_name)
 
 
 def parse_depends_on(task_block: str) -> List[str]:
@@ -90,12 +252,7 @@ def parse_depends_on(task_block: str) -> List[str]:
     Returns:
         List of task IDs or empty list
     """
-    depends_text = extract_text_field(task_block, "Depends On")
-
-    if not depends_text or depends_text == "(none)":
-        return []
-
-    return [t.strip() for t in depends_text.split(",")]
+    return TaskFields(task_block).depends_on()
 
 
 def parse_task_full(task_id: str, task_block: str, include_optional: bool = False) -> Dict:
@@ -109,16 +266,134 @@ def parse_task_full(task_id: str, task_block: str, include_optional: bool = Fals
     Returns:
         Dictionary with parsed task data
     """
+    fields = TaskFields(task_block)
     task_data = {
         "id": task_id,
-        "status": extract_field(task_block, "Status") or "pending",
-        "priority": extract_field(task_block, "Priority") or "medium",
-        "epic": extract_text_field(task_block, "Epic"),
-        "depends_on": parse_depends_on(task_block),
+        "status": fields.field("Status") or "pending",
+        "priority": fields.field("Priority") or "medium",
+        "epic": fields.text("Epic"),
+        "depends_on": fields.depends_on(),
     }
 
     if include_optional:
-        task_data["category"] = extract_field(task_block, "Category") or "chore"
-        task_data["description"] = extract_text_field(task_block, "Description") or ""
+        task_data["category"] = fields.field("Category") or "chore"
+        task_data["description"] = fields.text("Description") or ""
 
     return task_data
+
+
+def parse_task_record(task_id: str, task_block: str) -> Tuple:
+    """Parse every known field of a task block into a compact record.
+
+    Missing fields are left as None; Task.from_record applies the shared defaults.
+
+    Args:
+        task_id: Task ID (e.g., "TASK-001")
+        task_block: Task markdown block, including the header line
+
+    Returns:
+        (id, title, status, priority, category, epic, depends_on, description) tuple
+    """
+    fields = TaskFields(task_block)
+    return (
+        task_id,
+        parse_task_title(task_block) or task_id,
+        fields.field("Status"),
+        fields.field("Priority"),
+        fields.field("Category"),
+        fields.text("Epic"),
+        tuple(fields.depends_on()),
+        fields.field("Description", multiline=True),
+    )
+
+
+class Task:
+    """Compact task record produced by every task loader.
+
+    Uses __slots__ instead of a per-task dict, and interns the small
+    vocabularies (status, priority, category, epic) so 100k loaded tasks share
+    one string object per distinct value. Supports dict-style access
+    (task["id"], task.get("epic")) so existing callers keep working.
+    """
+
+    __slots__ = ("id", "title", "status", "priority", "category", "epic", "depends_on", "description")
+
+    def __init__(
+        self,
+        task_id: str,
+        title: str,
+        status: str = "pending",
+        priority: str = "medium",
+        category: str = "chore",
+        epic: Optional[str] = None,
+        depends_on: Sequence[str] = (),
+        description: str = "",
+    ) -> None:
+        self.id = task_id
+        self.title = title
+        self.status = sys.intern(status)
+        self.priority = sys.intern(priority)
+        self.category = sys.intern(category)
+        self.epic = sys.intern(epic) if epic else epic
+        self.depends_on = depends_on
+        self.description = description
+
+    @classmethod
+    def from_record(cls, record: Tuple) -> "Task":
+        """Build a Task from a parse_task_record tuple, applying default field values."""
+        task_id, title, status, priority, category, epic, depends_on, description = record
+        return cls(
+            task_id,
+            title,
+            status or "pending",
+            priority or "medium",
+            category or "chore",
+            epic,
+            depends_on,
+            description or "",
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy (e.g., for JSON output)."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get for task fields."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Task({self.id!r}, {self.title!r}, status={self.status!r}, priority={self.priority!r})"
+
+
+def iter_tasks(tasks_file: Path) -> Iterator[Task]:
+    """Stream Task objects from a file one block at a time (see iter_task_file).
+
+    Args:
+        tasks_file: Path to tasks markdown file
+
+    Yields:
+        Task objects in file order
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    for task_id, task_block, _, _ in iter_task_file(tasks_file):
+        yield Task.from_record(parse_task_record(task_id, task_block))
@@ -12,11 +12,12 @@ Validates task dependency integrity and detects issues:
 
 import json
 from pathlib import Path
-import re
 import sys
 from typing import Dict, List
 
-from markdown_parser import extract_field, extract_text_field, parse_task_blocks, parse_task_full
+from markdown_parser import TaskFields, parse_task_blocks
+from task_cache import load_cached_tasks
+from task_ids import task_id_sort_key
 
 
 class DependencySanitizer:
@@ -31,31 +32,13 @@ class DependencySanitizer:
         self._load_tasks()
 
     def _load_tasks(self) -> None:
-        """Load tasks from file using shared markdown parser."""
+        """Load tasks from file using the shared parsed-task cache."""
         if not self.tasks_file.exists():
             raise FileNotFoundError(f"Tasks file not found: {self.tasks_file}")
 
-        content = self.tasks_file.read_text()
-        blocks = parse_task_blocks(content)
-
-        for task_id, task_block in blocks:
-            # Extract title from first line of block only (not entire file)
-            lines = task_block.split("\n")
-            first_line = lines[0] if lines else ""
-            first_line_match = re.match(r"^##\s+\[TASK-\d{3}\]\s+(.+?)$", first_line)
-            title = first_line_match.group(1).strip() if first_line_match else task_id
-
-            # Parse task fields using shared parser
-            task_data = parse_task_full(task_id, task_block, include_optional=False)
-
-            self.tasks[task_id] = {
-                "title": title,
-                "status": task_data["status"],
-                "priority": task_data["priority"],
-                "epic": task_data["epic"],
-                "depends_on": task_data["depends_on"],
-            }
-            self.task_ids.add(task_id)
+        for task in load_cached_tasks(self.tasks_file):
+            self.tasks[task.id] = task
+            self.task_ids.add(task.id)
 
     def sanitize(self) -> Dict:
         """Run all validation checks."""
@@ -247,7 +230,7 @@ class DependencySanitizer:
 
         updated_lines = ["# Active Tasks\n"]
 
-        for task_id in sorted(self.tasks.keys()):
+        for task_id in sorted(self.tasks.keys(), key=task_id_sort_key):
             task = self.tasks[task_id]
             original_block = original_blocks_map.get(task_id, "")
 
@@ -259,26 +242,18 @@ class DependencySanitizer:
             updated_lines.append(f"**Priority**: {task['priority']}")
 
             # For other fields, preserve from original if not modified
-            # Extract original fields
-            if original_block:
-                original_category = extract_field(original_block, "Category") or ""
-                original_related = extract_text_field(original_block, "Related") or ""
-                original_origin = extract_field(original_block, "Origin") or ""
-                original_created = extract_field(original_block, "Created") or ""
-                original_description = extract_text_field(original_block, "Description") or ""
-
-                if original_category:
-                    updated_lines.append(f"**Category**: {original_category}")
-                else:
-                    updated_lines.append("**Category**: chore")
-            else:
-                updated_lines.append("**Category**: chore")
+            # Extract all original fields in one pass over the block
+            original = TaskFields(original_block) if original_block else None
+
+            original_category = original.field("Category") if original else None
+            updated_lines.append(f"**Category**: {original_category or 'chore'}")
 
             # Write epic if present
+            original_epic = original.text("Epic") if original else None
             if task.get("epic"):
                 updated_lines.append(f"**Epic**: {task['epic']}")
-            elif original_block and extract_text_field(original_block, "Epic"):
-                updated_lines.append(f"**Epic**: {extract_text_field(original_block, 'Epic')}")
+            elif original_epic:
+                updated_lines.append(f"**Epic**: {original_epic}")
 
             # Write depends_on (sanitizer may have modified this)
             if task.get("depends_on"):
@@ -287,24 +262,23 @@ class DependencySanitizer:
                 updated_lines.append("**Depends On**: (none)")
 
             # Preserve Related, Origin, Created
-            if original_block:
-                original_related = extract_text_field(original_block, "Related")
+            if original:
+                original_related = original.text("Related")
                 if original_related:
                     updated_lines.append(f"**Related**: {original_related}")
                 else:
                     updated_lines.append("**Related**: (none)")
 
-                original_origin = extract_field(original_block, "Origin")
+                original_origin = original.field("Origin")
                 if original_origin:
                     updated_lines.append(f"**Origin**: {original_origin}")
 
-                original_created = extract_field(original_block, "Created")
+                original_created = original.field("Created")
                 if original_created:
                     updated_lines.append(f"**Created**: {original_created}")
 
-            # Preserve Description
-            if original_block:
-                original_description = extract_text_field(original_block, "Description")
+                # Preserve Description
+                original_description = original.text("Description")
                 if original_description:
                     updated_lines.append(f"\n**Description**:\n{original_description}")
 
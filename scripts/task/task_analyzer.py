@@ -22,17 +22,31 @@ Uses 10-phase pipeline:
 10. Generate Reasoning (explain decisions)
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
 import re
 import sys
 from typing import Dict, List, Optional, Tuple
 
 from config import TaskAnalyzerConfig
-from markdown_parser import parse_task_blocks, parse_task_full
+from markdown_parser import Task
+from task_cache import get_cache_path, is_fresh, load_cached_tasks, read_cache, write_cache
+from task_duplicates import DuplicateDetector
+from task_ids import task_id_sort_key
 from task_matcher import TaskMatcher
 
 
+KEYWORD_INDEX_PREFIX = "keywords"
+
+
+def task_content_hash(task: Dict) -> bytes:
+    """Return the hash of the task text keywords are extracted from (title and description)."""
+    text = f"{task.get('title', '')}\0{task.get('description', '')}"
+    return hashlib.sha1(text.encode("utf-8")).digest()
+
+
 class TaskAnalyzer:
     """
     Analyzes noisy task descriptions to extract structured metadata.
@@ -43,13 +57,23 @@ class TaskAnalyzer:
     # INITIALIZATION
     # ========================================================================
 
-    def __init__(self, tasks: List[Dict], epics: Optional[List[str]] = None) -> None:
+    def __init__(
+        self,
+        tasks: List[Dict],
+        epics: Optional[List[str]] = None,
+        tasks_file: Optional[Path] = None,
+        stat: Optional[os.stat_result] = None,
+    ) -> None:
         """
         Initialize TaskAnalyzer with existing tasks and epics.
 
         Args:
             tasks: List of task dicts with id, title, description, epic, status, priority
             epics: List of epic names (auto-extracted from tasks if not provided)
+            tasks_file: File the tasks were loaded from; when given, the keyword
+                index is persisted next to it and only added or changed tasks are
+                re-tokenized on later runs
+            stat: Stat of tasks_file taken before tasks were loaded
         """
         # Common stopwords to ignore during analysis
         self.stopwords = {
@@ -142,21 +166,91 @@ class TaskAnalyzer:
             "few",
         }
 
-        # Initialize tasks and task_by_id
-        self.tasks = tasks
+        # Initialize tasks and task_by_id (own list: add_task/remove_task change it)
+        self.tasks = list(tasks)
         self.task_by_id = {t["id"]: t for t in tasks}
 
         # Build epic list from tasks or use provided
+        self._epics_from_tasks = not epics
         if epics:
             self.epics = epics
         else:
             self.epics = list({t.get("epic") for t in tasks if t.get("epic")})
 
-        # Pre-build keyword index for all tasks
-        self.keywords_by_task = self._build_keyword_index(tasks)
+        # Pre-build keyword index for all tasks (persisted per tasks file when known)
+        if tasks_file is not None:
+            self.keywords_by_task = self._load_keyword_index(tasks_file, tasks, stat)
+        else:
+            self.keywords_by_task = self._build_keyword_index(tasks)
+
+        # Task matcher for semantic search (extracted for Single Responsibility),
+        # built on first use: duplicate detection only needs the keyword index
+        self._matcher: Optional[TaskMatcher] = None
+
+    @property
+    def matcher(self) -> TaskMatcher:
+        """Return the task matcher, building it from the keyword index on first use."""
+        if self._matcher is None:
+            self._matcher = TaskMatcher(self.tasks, self.keywords_by_task)
+        return self._matcher
+
+    def add_task(self, task: Dict) -> None:
+        """
+        Add a task, or replace the task with the same ID, without rebuilding the analyzer.
+
+        Only this task is tokenized; the matcher (if built) is updated in place.
+
+        Args:
+            task: Task dict with id, title, description, epic, status, priority
+        """
+        task_id = task["id"]
+        previous = self.task_by_id.get(task_id)
+        if previous is None:
+            self.tasks.append(task)
+        else:
+            self.tasks = [task if t is previous else t for t in self.tasks]
+        self.task_by_id[task_id] = task
+
+        keywords = self._extract_task_keywords(task)
+        self.keywords_by_task[task_id] = keywords
+
+        if self._epics_from_tasks:
+            if previous is not None:
+                self._drop_unused_epic(previous.get("epic"))
+            if task.get("epic") and task["epic"] not in self.epics:
+                self.epics.append(task["epic"])
 
-        # Initialize task matcher for semantic search (extracted for Single Responsibility)
-        self.matcher = TaskMatcher(self.tasks, self.keywords_by_task)
+        if self._matcher is not None:
+            self._matcher.add_task(task, keywords)
+
+    def remove_task(self, task_id: str) -> bool:
+        """
+        Remove a task by ID without rebuilding the analyzer.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            True if the task was present
+        """
+        task = self.task_by_id.pop(task_id, None)
+        if task is None:
+            return False
+
+        self.tasks = [t for t in self.tasks if t is not task]
+        self.keywords_by_task.pop(task_id, None)
+
+        if self._epics_from_tasks:
+            self._drop_unused_epic(task.get("epic"))
+
+        if self._matcher is not None:
+            self._matcher.remove_task(task_id)
+        return True
+
+    def _drop_unused_epic(self, epic: Optional[str]) -> None:
+        """Remove an auto-extracted epic once no task references it."""
+        if epic in self.epics and not any(t.get("epic") == epic for t in self.tasks):
+            self.epics.remove(epic)
 
     def analyze(self, user_input: str) -> Dict:
         """
@@ -497,7 +591,7 @@ class TaskAnalyzer:
             if self._task_exists(dep_id) and not self._task_completed(dep_id):
                 valid_deps.append(dep_id)
 
-        return sorted(valid_deps)
+        return sorted(valid_deps, key=task_id_sort_key)
 
     def _task_exists(self, task_id: str) -> bool:
         """Check if task exists"""
@@ -645,54 +739,90 @@ class TaskAnalyzer:
         related = [t for t in related if t not in depends_on]
         return related
 
+    def _extract_task_keywords(self, task: Dict) -> List[str]:
+        """Extract keywords from a task's title and description"""
+        title = task.get("title", "")
+        description = task.get("description", "")
+        return self._extract_keywords(f"{title} {description}")
+
     def _build_keyword_index(self, tasks: List[Dict]) -> Dict[str, List[str]]:
         """Pre-process: build keyword index for all tasks"""
         index = {}
         for task in tasks:
-            title = task.get("title", "")
-            description = task.get("description", "")
-            keywords = self._extract_keywords(f"{title} {description}")
-            index[task["id"]] = keywords
+            index[task["id"]] = self._extract_task_keywords(task)
         return index
 
+    def _load_keyword_index(
+        self, tasks_file: Path, tasks: List[Dict], stat: Optional[os.stat_result] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Load the keyword index persisted for tasks_file, re-tokenizing only added or changed tasks.
 
-# ============================================================================
-# CLI Interface
-# ============================================================================
+        Keywords are stored with a hash of each task's title and description, so
+        when the file changed, tasks whose hash still matches reuse their keywords.
+        A different stopword list invalidates the whole index.
 
+        Args:
+            tasks_file: Path to tasks.md
+            tasks: Tasks as loaded from tasks_file
+            stat: File stat taken before tasks were loaded; stamping the index with it
+                means a file rewritten mid-load is re-checked on the next call
 
-def load_tasks_from_file(tasks_file: Path) -> List[Dict]:
-    """Load tasks from tasks.md file using shared markdown parser."""
-    if not tasks_file.exists():
-        raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
+        Returns:
+            Dict mapping task_id → extracted keywords
+        """
+        if stat is None:
+            stat = tasks_file.stat()
 
-    content = tasks_file.read_text()
-    tasks = []
+        cache_path = get_cache_path(tasks_file, KEYWORD_INDEX_PREFIX)
+        entry = read_cache(cache_path)
+        stopwords = sorted(self.stopwords)
 
-    # Parse markdown using shared parser (single source of truth)
-    blocks = parse_task_blocks(content)
+        if entry is None or entry.get("stopwords") != stopwords:
+            entry = {"keywords": {}, "hashes": {}}
+        elif is_fresh(entry, stat) and entry["count"] == len(tasks):
+            return entry["keywords"]
 
-    for task_id, task_block in blocks:
-        # Extract title from markdown header
-        pattern = r"^##\s+\[TASK-\d{3}\]\s+(.+?)$"
-        first_line = task_block.split("\n")[0] if task_block else ""
-        title_match = re.match(pattern, first_line)
-        title = title_match.group(1).strip() if title_match else task_id
+        previous_keywords = entry["keywords"]
+        previous_hashes = entry["hashes"]
+        index: Dict[str, List[str]] = {}
+        hashes: Dict[str, bytes] = {}
 
-        # Parse task fields using shared parser
-        task_data = parse_task_full(task_id, task_block, include_optional=True)
+        for task in tasks:
+            task_id = task["id"]
+            digest = task_content_hash(task)
+            if previous_hashes.get(task_id) == digest:
+                index[task_id] = previous_keywords[task_id]
+            else:
+                index[task_id] = self._extract_task_keywords(task)
+            hashes[task_id] = digest
 
-        tasks.append(
+        write_cache(
+            cache_path,
             {
-                "id": task_id,
-                "title": title,
-                "status": task_data["status"],
-                "priority": task_data["priority"],
-                "category": task_data.get("category", "chore"),
-                "epic": task_data["epic"],
-                "description": task_data.get("description", ""),
-            }
+                "stopwords": stopwords,
+                "count": len(tasks),
+                "keywords": index,
+                "hashes": hashes,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
         )
+        return index
+
+
+# ============================================================================
+# CLI Interface
+# ============================================================================
+
+
+def load_tasks_from_file(tasks_file: Path) -> List[Task]:
+    """Load tasks from tasks.md file using the shared parsed-task cache."""
+    if not tasks_file.exists():
+        raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
+
+    # Parsed records come from the shared task cache (single source of truth)
+    tasks = load_cached_tasks(tasks_file)
 
     return tasks
 
@@ -701,6 +831,7 @@ def main() -> None:
     """CLI interface for task analyzer"""
     if len(sys.argv) < 2:
         print("Usage: task_analyzer.py analyze <tasks-file> <user-input>")
+        print("       task_analyzer.py duplicates <tasks-file> [--threshold=0.8]")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -714,8 +845,9 @@ def main() -> None:
         user_input = " ".join(sys.argv[3:])
 
         try:
+            stat = tasks_file.stat() if tasks_file.exists() else None
             tasks = load_tasks_from_file(tasks_file)
-            analyzer = TaskAnalyzer(tasks)
+            analyzer = TaskAnalyzer(tasks, tasks_file=tasks_file, stat=stat)
             result = analyzer.analyze(user_input)
 
             print(json.dumps(result, indent=2))
@@ -725,6 +857,31 @@ def main() -> None:
             print(json.dumps({"error": str(e)}), file=sys.stderr)
             sys.exit(1)
 
+    elif command == "duplicates":
+        if len(sys.argv) < 3:
+            print("Usage: task_analyzer.py duplicates <tasks-file> [--threshold=0.8]")
+            sys.exit(1)
+
+        tasks_file = Path(sys.argv[2].replace("~", str(Path.home())))
+        threshold = TaskAnalyzerConfig.DUPLICATE_THRESHOLD
+        for arg in sys.argv[3:]:
+            if arg.startswith("--threshold="):
+                threshold = float(arg.split("=", 1)[1])
+
+        try:
+            stat = tasks_file.stat() if tasks_file.exists() else None
+            tasks = load_tasks_from_file(tasks_file)
+            analyzer = TaskAnalyzer(tasks, tasks_file=tasks_file, stat=stat)
+            detector = DuplicateDetector(analyzer.tasks, analyzer.keywords_by_task)
+            result = detector.find_duplicates(threshold)
+
+            print(json.dumps(result, indent=2))
+            sys.exit(0)
+
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
     else:
         print(f"Unknown command: {command}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+"""Persistent parsed-task cache for task markdown files.
+
+Stores fully parsed task records next to the tasks file
+(e.g. .agent/.cache/tasks.<fingerprint>) so repeated CLI invocations
+can skip regex parsing entirely while the file is unchanged.
+
+Cache entries are keyed by path, size, mtime and content hash:
+- size + mtime match → records are returned without reading the tasks file
+- size + mtime differ but content hash matches → entry is re-stamped and reused
+- otherwise → file is re-parsed and the entry rewritten
+
+A small LRU of finished search responses (.agent/.cache/results.<fingerprint>)
+is validated the same way, so a repeated search is answered without parsing.
+Hits don't rewrite the LRU: they append a key digest to a sibling hits log
+(results.<fingerprint>.hits), which the next write folds into the LRU order.
+"""
+
+import hashlib
+import marshal
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from markdown_parser import Task, iter_task_file, parse_task_record
+
+
+CACHE_VERSION = 2
+CACHE_DIR_NAME = ".cache"
+RESULTS_PREFIX = "results"
+
+
+def get_cache_dir(tasks_file: Path) -> Path:
+    """Return the cache directory used for a tasks file (sibling .cache directory)."""
+    return tasks_file.parent / CACHE_DIR_NAME
+
+
+def get_cache_path(tasks_file: Path, prefix: str) -> Path:
+    """
+    Return the cache file path for a tasks file.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+        prefix: Cache kind (e.g., "tasks")
+
+    Returns:
+        Path like .agent/.cache/<prefix>.<fingerprint>
+    """
+    fingerprint = hashlib.sha1(str(tasks_file.resolve()).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir(tasks_file) / f"{prefix}.{fingerprint}"
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the content hash used to validate cache entries (read in fixed-size chunks)."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_cache(cache_path: Path) -> Optional[Dict]:
+    """
+    Read a marshalled cache entry.
+
+    Returns:
+        Cache entry dict, or None if missing, unreadable or from another cache version
+    """
+    try:
+        # marshal.load on a file object reads piecemeal; loads on one read is ~10x faster
+        entry = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+
+    return entry
+
+
+def atomic_write_bytes(target_path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    Write bytes to target_path atomically using temp file + rename.
+
+    Args:
+        target_path: File to replace
+        data: Complete new file contents
+        mode: Optional permission bits to apply to the new file (e.g., the original file's mode)
+
+    Raises:
+        OSError: If write operation fails
+    """
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=target_path.parent)
+
+    try:
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            Path(temp_path).chmod(mode)
+        Path(temp_path).replace(target_path)
+    except Exception:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_cache(cache_path: Path, entry: Dict) -> None:
+    """
+    Write a cache entry atomically (temp file + rename).
+
+    Cache writes are best-effort: filesystem errors are ignored so a read-only
+    .agent directory never breaks task commands.
+    """
+    entry["version"] = CACHE_VERSION
+    try:
+        atomic_write_bytes(cache_path, marshal.dumps(entry))
+    except (OSError, ValueError):
+        return
+
+
+def is_fresh(entry: Optional[Dict], stat: os.stat_result) -> bool:
+    """Check whether a cache entry was stamped with the file's current size and mtime."""
+    return entry is not None and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def parse_task_file(tasks_file: Path) -> List[Tuple]:
+    """
+    Parse a tasks file into records without consulting the cache.
+
+    Blocks are streamed off a memory map so the file is never held in memory as text.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+
+    Returns:
+        List of records as produced by markdown_parser.parse_task_record
+    """
+    return [parse_task_record(task_id, task_block) for task_id, task_block, _, _ in iter_task_file(tasks_file)]
+
+
+def load_task_records(tasks_file: Path) -> List[Tuple]:
+    """
+    Load parsed task records, using the on-disk cache when the file is unchanged.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+
+    Returns:
+        List of records as produced by markdown_parser.parse_task_record
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    stat = tasks_file.stat()
+    cache_path = get_cache_path(tasks_file, "tasks")
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat):
+        return entry["records"]
+
+    digest = file_digest(tasks_file)
+
+    if entry is None or entry.get("sha256") != digest:
+        entry = {"sha256": digest, "records": parse_task_file(tasks_file)}
+
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    write_cache(cache_path, entry)
+
+    return entry["records"]
+
+
+def load_cached_tasks(tasks_file: Path) -> List[Task]:
+    """
+    Load tasks as Task objects via the parsed-task cache.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+
+    Returns:
+        List of Task objects in file order
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    return [Task.from_record(record) for record in load_task_records(tasks_file)]
+
+
+def _load_results_entry(tasks_file: Path, prefix: str = RESULTS_PREFIX) -> Tuple[Path, Dict, bool]:
+    """
+    Load a result cache for tasks_file, emptying it if the file's content changed.
+
+    Returns:
+        Tuple of (cache path, entry, whether the entry must be written back)
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    stat = tasks_file.stat()
+    cache_path = get_cache_path(tasks_file, prefix)
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat):
+        return cache_path, entry, False
+
+    digest = file_digest(tasks_file)
+
+    if entry is None or entry.get("sha256") != digest:
+        entry = {"sha256": digest, "results": {}}
+
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return cache_path, entry, True
+
+
+def _hits_log_path(cache_path: Path) -> Path:
+    """Return the hits log of a result cache (key digests of hits not yet folded into the LRU order)."""
+    return cache_path.with_name(f"{cache_path.name}.hits")
+
+
+def _key_digest(key: str) -> str:
+    """Return the fixed-width digest that identifies a result key in the hits log."""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _record_hit(cache_path: Path, key: str) -> None:
+    """Append a hit to the hits log (best-effort, like write_cache)."""
+    try:
+        with _hits_log_path(cache_path).open("a") as f:
+            f.write(_key_digest(key) + "\n")
+    except OSError:
+        return
+
+
+def _fold_hits(cache_path: Path, results: Dict) -> None:
+    """Move logged hits to the most recently used end of results, in hit order, and clear the log."""
+    hits_path = _hits_log_path(cache_path)
+    try:
+        hits = hits_path.read_text().split()
+        hits_path.unlink()
+    except OSError:
+        return
+
+    keys = {_key_digest(key): key for key in results}
+    for digest in hits:
+        key = keys.get(digest)
+        if key is not None:
+            results[key] = results.pop(key)
+
+
+def get_cached_result(tasks_file: Path, key: str, ttl_seconds: float = 0, prefix: str = RESULTS_PREFIX):
+    """
+    Look up a cached result for tasks_file and mark it most recently used.
+
+    A hit only appends to the hits log instead of rewriting the cache file; the
+    file itself is rewritten only when the tasks file changed (to re-stamp or
+    empty the entry) or the result has expired.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+        key: Result key (e.g., normalized query and options)
+        ttl_seconds: Maximum age of a usable result (0 = no expiry)
+        prefix: Cache kind (separate LRUs for different kinds of results)
+
+    Returns:
+        Cached value, or None on a miss, an expired entry or a changed file
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    cache_path, entry, dirty = _load_results_entry(tasks_file, prefix)
+    item = entry["results"].get(key)
+
+    if item is not None and ttl_seconds > 0 and time.time() - item[0] > ttl_seconds:
+        del entry["results"][key]
+        item = None
+        dirty = True
+
+    if dirty:
+        _fold_hits(cache_path, entry["results"])
+        if item is not None:
+            entry["results"][key] = entry["results"].pop(key)
+        write_cache(cache_path, entry)
+    elif item is not None:
+        _record_hit(cache_path, key)
+
+    return item[1] if item is not None else None
+
+
+def put_cached_result(
+    tasks_file: Path, key: str, value, max_entries: int, ttl_seconds: float = 0, prefix: str = RESULTS_PREFIX
+) -> None:
+    """
+    Store a result for tasks_file, evicting expired and least recently used entries.
+
+    Args:
+        tasks_file: Path to tasks markdown file
+        key: Result key
+        value: marshal-serializable value
+        max_entries: Maximum number of results kept (0 disables caching)
+        ttl_seconds: Maximum age of a kept result (0 = no expiry)
+        prefix: Cache kind (see get_cached_result)
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    if max_entries <= 0:
+        return
+
+    cache_path, entry, _ = _load_results_entry(tasks_file, prefix)
+    results = entry["results"]
+    _fold_hits(cache_path, results)
+    now = time.time()
+
+    if ttl_seconds > 0:
+        for stale in [name for name, item in results.items() if now - item[0] > ttl_seconds]:
+            del results[stale]
+
+    results.pop(key, None)
+    results[key] = (now, value)
+
+    while len(results) > max_entries:
+        del results[next(iter(results))]
+
+    write_cache(cache_path, entry)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+Resident task query daemon over a Unix socket
+
+Keeps parsed tasks, search indexes and a TaskAnalyzer warm so /task:search and
+/task:add don't pay for imports, parsing and index loading on every call.
+tasks.md is re-checked (size + mtime) before each query and reloaded when it
+changed.
+
+Protocol: one JSON request per line, one JSON response per line.
+    {"command": "search", "query": "...", "args": ["--limit=5", ...]}  # or "limit": 5, ...
+    {"command": "analyze", "input": "..."}
+    {"command": "complete", "prefix": "...", "args": [...]}  # or "limit"/"include_completed"
+    {"command": "ping"} / {"command": "stop"}
+Responses are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+
+The client commands (search, analyze, complete) talk to a running daemon and fall
+back to in-process execution when none is listening, so their output is the same
+either way. This module is the client and only needs the standard library; the
+service and server live in task_service, which is imported only to serve or to
+answer a request in-process.
+
+Usage:
+    task_daemon.py serve <tasks-file>                        # foreground; use nohup/& to background
+    task_daemon.py status <tasks-file>
+    task_daemon.py stop <tasks-file>
+    task_daemon.py search <query> <tasks-file> [search flags]  # same flags as task_search.py search
+    task_daemon.py analyze <tasks-file> <user-input>
+    task_daemon.py complete <prefix> <tasks-file> [--limit=5] [--completed]
+"""
+
+import hashlib
+import json
+from pathlib import Path
+import socket
+import sys
+import tempfile
+from typing import Dict, Optional
+
+
+SOCKET_PREFIX = "daemon"
+CACHE_DIR_NAME = ".cache"  # as task_cache.CACHE_DIR_NAME
+# Unix sockets are missing on some platforms (e.g., older Windows); clients then always run in-process
+HAVE_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+CLIENT_TIMEOUT_SECONDS = 10.0
+# sockaddr_un.sun_path is 104-108 bytes depending on platform
+MAX_SOCKET_PATH_LENGTH = 100
+
+
+def get_socket_path(tasks_file: Path) -> Path:
+    """
+    Return the daemon socket path for a tasks file.
+
+    Lives next to the other caches (.agent/.cache/daemon.<fingerprint>.sock, with the
+    fingerprint of task_cache.get_cache_path, which is not imported to keep the
+    client light), or in the system temp directory when that path is too long for
+    a Unix socket.
+    """
+    fingerprint = hashlib.sha1(str(tasks_file.resolve()).encode("utf-8")).hexdigest()[:16]
+    socket_path = tasks_file.parent / CACHE_DIR_NAME / f"{SOCKET_PREFIX}.{fingerprint}.sock"
+
+    if len(str(socket_path)) > MAX_SOCKET_PATH_LENGTH:
+        socket_path = Path(tempfile.gettempdir()) / f"task-{socket_path.name}"
+
+    return socket_path
+
+
+def send_request(socket_path: Path, request: Dict, timeout: float = CLIENT_TIMEOUT_SECONDS) -> Optional[Dict]:
+    """
+    Send one request to a running daemon.
+
+    Args:
+        socket_path: Daemon socket path
+        request: Request dict
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Response dict, or None if no daemon answered usably (no Unix sockets, no
+        listener, a stale or foreign socket, a timeout or a truncated reply)
+    """
+    if not HAVE_UNIX_SOCKETS:
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def query(tasks_file: Path, request: Dict) -> Dict:
+    """
+    Run a request on the daemon if one is serving tasks_file, otherwise in-process.
+
+    Args:
+        tasks_file: Path to .agent/tasks.md
+        request: Request dict
+
+    Returns:
+        Response dict
+    """
+    response = send_request(get_socket_path(tasks_file), request)
+    if response is not None:
+        return response
+
+    from task_service import TaskQueryService
+
+    return TaskQueryService(tasks_file).handle(request)
+
+
+def serve(tasks_file: Path) -> None:
+    """
+    Run the daemon in the foreground until stopped.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable or a daemon is already serving this tasks file
+    """
+    if not HAVE_UNIX_SOCKETS:
+        raise RuntimeError("Unix sockets are not available on this platform; use the in-process CLIs")
+
+    from task_service import TaskDaemonServer, TaskQueryService
+
+    socket_path = get_socket_path(tasks_file)
+
+    if send_request(socket_path, {"command": "ping"}, timeout=1.0) is not None:
+        raise RuntimeError(f"Daemon already running on {socket_path}")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)  # stale socket from a crashed daemon
+
+    service = TaskQueryService(tasks_file)
+    service.refresh()
+
+    with TaskDaemonServer(socket_path, service) as server:
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def _print_response(response: Dict) -> None:
+    """Print a response the way the in-process CLIs do and exit accordingly."""
+    if response.get("ok"):
+        print(json.dumps(response["result"], indent=2))
+        sys.exit(0)
+
+    print(json.dumps({"error": response.get("error", "unknown error")}), file=sys.stderr)
+    sys.exit(1)
+
+
+def main() -> None:
+    """CLI interface for the task query daemon"""
+    if len(sys.argv) < 3:
+        print("Usage: task_daemon.py serve|status|stop <tasks-file>")
+        print("       task_daemon.py search <query> <tasks-file> [--limit=5] [--completed] [--rank=...] [--fuzzy]")
+        print("       task_daemon.py analyze <tasks-file> <user-input>")
+        print("       task_daemon.py complete <prefix> <tasks-file> [--limit=5] [--completed]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "serve":
+        tasks_file = Path(sys.argv[2])
+        try:
+            serve(tasks_file)
+        except (OSError, RuntimeError) as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
+    elif command == "status":
+        response = send_request(get_socket_path(Path(sys.argv[2])), {"command": "ping"})
+        status = {"running": response is not None}
+        if response is not None and response.get("ok"):
+            status.update(response["result"])
+        print(json.dumps(status))
+
+    elif command == "stop":
+        response = send_request(get_socket_path(Path(sys.argv[2])), {"command": "stop"})
+        print(json.dumps({"stopped": response is not None}))
+
+    elif command == "search":
+        if len(sys.argv) < 4:
+            print("Usage: task_daemon.py search <query> <tasks-file> [search flags]")
+            sys.exit(1)
+        request = {"command": "search", "query": sys.argv[2], "args": sys.argv[4:]}
+        _print_response(query(Path(sys.argv[3]), request))
+
+    elif command == "complete":
+        if len(sys.argv) < 4:
+            print("Usage: task_daemon.py complete <prefix> <tasks-file> [--limit=5] [--completed]")
+            sys.exit(1)
+        request = {"command": "complete", "prefix": sys.argv[2], "args": sys.argv[4:]}
+        _print_response(query(Path(sys.argv[3]), request))
+
+    elif command == "analyze":
+        if len(sys.argv) < 4:
+            print("Usage: task_daemon.py analyze <tasks-file> <user-input>")
+            sys.exit(1)
+        tasks_file = Path(sys.argv[2].replace("~", str(Path.home())))
+        _print_response(query(tasks_file, {"command": "analyze", "input": " ".join(sys.argv[3:])}))
+
+    else:
+        print(f"Unknown command: {command}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
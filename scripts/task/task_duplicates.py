@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+"""Near-duplicate task detection module.
+
+Finds groups of tasks whose keyword sets (TaskAnalyzer._build_keyword_index)
+have a Jaccard similarity at or above a threshold, without comparing every
+pair of tasks:
+
+1. MinHash: each task's keyword set becomes a fixed-size signature whose
+   positions agree between two tasks with probability ≈ their Jaccard similarity
+2. LSH banding: signatures are cut into bands; tasks sharing any whole band
+   land in the same bucket and become candidate pairs
+3. Verification: candidate pairs are re-scored with the exact Jaccard
+   similarity as each bucket streams out, so reported pairs are never false
+   positives
+4. Clustering: verified pairs are merged into connected groups (union-find);
+   a pair whose tasks already share a cluster is not re-checked
+
+Each distinct keyword is hashed once into one value per signature position
+(independent hash functions from a single SHAKE-128 digest); a task's
+signature is the position-wise minimum over its keywords. Tasks with
+identical keyword sets share one signature. Large backlogs use the optional
+NumPy backend (task_vectors) for signatures and bucketing, with identical
+results.
+"""
+
+from array import array
+import hashlib
+import struct
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from config import TaskAnalyzerConfig
+from task_vectors import use_vectors
+
+
+# Keyword sets per np.minimum.reduceat call (bounds the gathered hash rows in memory)
+SIGNATURE_CHUNK = 2048
+
+
+def keyword_hashes(keyword: str, size: int) -> Tuple[int, ...]:
+    """Return size independent 32-bit hashes of a keyword (stable across runs, unlike hash())."""
+    return struct.unpack(f"<{size}I", hashlib.shake_128(keyword.encode("utf-8")).digest(4 * size))
+
+
+def minhash_signature(keyword_values: Iterable[Tuple[int, ...]]) -> Optional[Tuple[int, ...]]:
+    """
+    Build a MinHash signature from the keyword_hashes of a task's distinct keywords.
+
+    Returns:
+        Position-wise minimum over all keywords, or None for an empty keyword set
+    """
+    rows = list(keyword_values)
+    if not rows:
+        return None
+    return tuple(map(min, zip(*rows)))
+
+
+def lsh_bands(threshold: float, signature_size: int, target_recall: float) -> Tuple[int, int]:
+    """
+    Choose the LSH band layout for a similarity threshold.
+
+    Two tasks with Jaccard similarity s share at least one band with probability
+    1 - (1 - s^rows)^bands. More rows per band means fewer dissimilar candidates,
+    so this picks the most rows that still catch a pair at exactly `threshold`
+    with probability target_recall (e.g., 0.8 with 128 positions → 21 bands × 6 rows).
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    for rows in range(signature_size, 0, -1):
+        bands = signature_size // rows
+        if 1 - (1 - threshold**rows) ** bands >= target_recall:
+            return bands, rows
+    return signature_size, 1
+
+
+class DuplicateDetector:
+    """Finds clusters of near-duplicate tasks with MinHash + LSH and exact verification."""
+
+    def __init__(
+        self,
+        tasks: List[Dict],
+        keywords_by_task: Dict[str, List[str]],
+        signature_size: int = TaskAnalyzerConfig.MINHASH_SIGNATURE_SIZE,
+    ) -> None:
+        """Initialize detector with task list and pre-computed keywords.
+
+        Tasks with identical keyword sets are grouped up front: they are
+        duplicates of each other by definition and only one of them needs a
+        signature.
+
+        Args:
+            tasks: List of task dictionaries
+            keywords_by_task: Dict mapping task_id → extracted keywords
+            signature_size: MinHash positions per task
+        """
+        self.tasks = tasks
+        self.signature_size = signature_size
+        self._keyword_sets: List[FrozenSet[str]] = []
+        self._groups: Dict[FrozenSet[str], List[int]] = {}
+
+        for position, task in enumerate(tasks):
+            keywords = frozenset(keywords_by_task.get(task["id"], []))
+            self._keyword_sets.append(keywords)
+            if keywords and task.get("status") != "deleted":
+                self._groups.setdefault(keywords, []).append(position)
+
+    def candidate_buckets(self, bands: int, rows: int) -> Iterator[List[int]]:
+        """
+        Yield LSH buckets holding more than one distinct keyword set.
+
+        Each bucket lists representative task positions (one per keyword set),
+        ascending or, past LSH_BUCKET_LIMIT, sorted by signature. Buckets come band
+        by band, ordered by their first member, with either backend: the NumPy
+        backend (task_vectors) is used for large backlogs when available and
+        produces the same buckets.
+
+        Args:
+            bands: Number of bands
+            rows: Signature positions per band
+        """
+        keyword_sets = list(self._groups)
+        representatives = [positions[0] for positions in self._groups.values()]
+
+        if use_vectors(len(keyword_sets)):
+            buckets = self._vector_buckets(keyword_sets, bands, rows)
+        else:
+            buckets = self._buckets(keyword_sets, bands, rows)
+
+        # Groups are numbered in task order, so representatives stay ordered
+        for members in buckets:
+            yield [representatives[group] for group in members]
+
+    def _buckets(self, keyword_sets: List[FrozenSet[str]], bands: int, rows: int) -> Iterator[List[int]]:
+        """Yield LSH buckets of group indexes holding more than one keyword set (pure Python).
+
+        Members are ascending, except in buckets over LSH_BUCKET_LIMIT, which are
+        sorted by signature rotated to start after their band (see find_duplicates).
+        """
+        hashes: Dict[str, Tuple[int, ...]] = {}
+        signatures: List[Tuple[int, ...]] = []
+        band_buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        band_slices = [slice(band * rows, (band + 1) * rows) for band in range(bands)]
+
+        for group, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                if keyword not in hashes:
+                    hashes[keyword] = keyword_hashes(keyword, self.signature_size)
+
+            signature = minhash_signature(hashes[keyword] for keyword in keywords)
+            signatures.append(signature)
+            for buckets, band_slice in zip(band_buckets, band_slices):
+                buckets.setdefault(signature[band_slice], []).append(group)
+
+        for band, buckets in enumerate(band_buckets):
+            rotation = (band + 1) * rows
+            for members in buckets.values():
+                if len(members) > TaskAnalyzerConfig.LSH_BUCKET_LIMIT:
+                    members.sort(key=lambda group: signatures[group][rotation:] + signatures[group][:rotation])
+                if len(members) > 1:
+                    yield members
+
+    def _vector_buckets(self, keyword_sets: List[FrozenSet[str]], bands: int, rows: int) -> Iterator[List[int]]:
+        """
+        Yield the same buckets as _buckets, computed with NumPy.
+
+        Signatures are position-wise minima over rows of a vocabulary × position
+        hash matrix (np.minimum.reduceat, in chunks to bound memory); each band is
+        reduced to one 64-bit key and equal keys are found by sorting. A key
+        collision between different bands only adds a candidate, which exact
+        verification then rejects.
+        """
+        import numpy as np
+
+        term_ids: Dict[str, int] = {}
+        entries = array("i")
+        starts = array("q")
+        for keywords in keyword_sets:
+            starts.append(len(entries))
+            for keyword in keywords:
+                entries.append(term_ids.setdefault(keyword, len(term_ids)))
+
+        size = self.signature_size
+        hashes = np.frombuffer(
+            b"".join(hashlib.shake_128(keyword.encode("utf-8")).digest(4 * size) for keyword in term_ids),
+            dtype="<u4",
+        ).reshape(len(term_ids), size)
+        entries = np.frombuffer(entries, dtype=np.intc)
+        starts = np.frombuffer(starts, dtype=np.int64)
+
+        signatures = np.empty((len(keyword_sets), size), dtype=np.uint64)
+        for low in range(0, len(keyword_sets), SIGNATURE_CHUNK):
+            high = min(low + SIGNATURE_CHUNK, len(keyword_sets))
+            first_entry = starts[low]
+            last_entry = starts[high] if high < len(keyword_sets) else len(entries)
+            signatures[low:high] = np.minimum.reduceat(
+                hashes[entries[first_entry:last_entry]], starts[low:high] - first_entry, axis=0
+            )
+
+        multipliers = np.frombuffer(hashlib.shake_128(b"lsh-bands").digest(8 * rows), dtype="<u8") | np.uint64(1)
+        for band in range(bands):
+            keys = signatures[:, band * rows : (band + 1) * rows] @ multipliers
+            order = np.argsort(keys, kind="stable")
+            ordered = keys[order]
+
+            # Keep only rows whose key repeats, then split them into runs of equal keys
+            repeated = ordered[1:] == ordered[:-1]
+            shared = np.zeros(len(ordered), dtype=bool)
+            shared[1:] |= repeated
+            shared[:-1] |= repeated
+            rows_in_runs = np.flatnonzero(shared)
+            boundaries = np.flatnonzero(np.diff(ordered[rows_in_runs])) + 1
+
+            # The stable sort keeps each run ascending; order runs by first member like _buckets
+            runs = [members.tolist() for members in np.split(order[rows_in_runs], boundaries)]
+            runs.sort(key=lambda members: members[0])
+            for members in runs:
+                if len(members) > TaskAnalyzerConfig.LSH_BUCKET_LIMIT:
+                    # Stable lexicographic sort of the members' rotated signature rows, like _buckets
+                    rotated = np.roll(signatures[members], -(band + 1) * rows, axis=1)
+                    members = [members[i] for i in np.lexsort(rotated.T[::-1]).tolist()]
+                yield members
+
+    def find_duplicates(
+        self,
+        threshold: float = TaskAnalyzerConfig.DUPLICATE_THRESHOLD,
+        target_recall: float = TaskAnalyzerConfig.LSH_TARGET_RECALL,
+    ) -> Dict:
+        """
+        Find clusters of tasks whose keyword similarity reaches threshold (deleted tasks excluded).
+
+        Buckets are verified as they stream out of candidate_buckets, and a pair is
+        skipped once both tasks already share a cluster, so memory stays bounded by
+        the number of tasks rather than candidate pairs. A bucket larger than
+        LSH_BUCKET_LIMIT (a band value shared by many tasks, e.g. in a backlog with
+        a small vocabulary) is sorted by signature, starting after the bucket's own
+        band so each band orders its tasks differently, and each task is compared
+        only with its next LSH_NEIGHBOURS tasks there: near-duplicates agree on most
+        signature positions and sort close together. Clusters are the connected
+        groups of verified pairs; each keeps its verified pair count and only its
+        MAX_REPORTED_PAIRS most similar pairs.
+
+        Args:
+            threshold: Minimum exact Jaccard similarity of a duplicate pair (0.0-1.0)
+            target_recall: Chance that a pair at exactly threshold becomes a candidate
+                (pairs above the threshold are caught more reliably)
+
+        Returns:
+            Dict with tasks, threshold, bands, rows, compared_pairs (exact similarity
+            checks), verified_pairs (pairs that joined a cluster) and clusters
+            (largest first; each with task_ids, tasks, max_similarity, pair_count
+            and pairs)
+        """
+        bands, rows = lsh_bands(threshold, self.signature_size, target_recall)
+        limit = TaskAnalyzerConfig.MAX_REPORTED_PAIRS
+        parent = list(range(len(self.tasks)))
+        members: Dict[int, List[int]] = {}
+        # Per cluster root: [verified pair count, most similar (similarity, first, second) pairs]
+        stats: Dict[int, List] = {}
+
+        def find(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        def link(first: int, second: int, similarity: float) -> None:
+            root, other = find(first), find(second)
+            cluster = stats.setdefault(root, [0, []])
+            members.setdefault(root, [root])
+            if other != root:
+                parent[other] = root
+                merged = stats.pop(other, None)
+                if merged is not None:
+                    cluster[0] += merged[0]
+                    cluster[1].extend(merged[1])
+                members[root].extend(members.pop(other, [other]))
+
+            cluster[0] += 1
+            cluster[1].append((similarity, first, second))
+            if len(cluster[1]) > 2 * limit:
+                cluster[1].sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+                del cluster[1][limit:]
+
+        # Identical keyword sets: similarity 1.0 with the group's first task
+        for positions in self._groups.values():
+            for position in positions[1:]:
+                link(positions[0], position, 1.0)
+
+        keyword_sets = self._keyword_sets
+        sizes = [len(keywords) for keywords in keyword_sets]
+        compared = 0
+
+        for bucket in self.candidate_buckets(bands, rows):
+            # Oversized buckets (common band values) compare only signature-sorted neighbours
+            fan_out = len(bucket)
+            if fan_out > TaskAnalyzerConfig.LSH_BUCKET_LIMIT:
+                fan_out = TaskAnalyzerConfig.LSH_NEIGHBOURS
+
+            for i, first in enumerate(bucket):
+                first_keywords = keyword_sets[first]
+                first_size = sizes[first]
+                smallest = threshold * first_size
+                root = find(first)
+
+                for second in bucket[i + 1 : i + 1 + fan_out]:
+                    # Jaccard similarity can't exceed the smaller/larger size ratio
+                    second_size = sizes[second]
+                    if second_size < smallest or threshold * second_size > first_size:
+                        continue
+                    if (second if parent[second] == second else find(second)) == root:
+                        continue
+
+                    compared += 1
+                    shared = len(first_keywords & keyword_sets[second])
+                    similarity = shared / (first_size + second_size - shared)
+                    if similarity >= threshold:
+                        # Representatives stand for their whole group (already linked above)
+                        link(first, second, similarity)
+                        root = find(first)
+
+        clusters = [self._format_cluster(members[root], *stats[root]) for root in stats]
+        clusters.sort(key=lambda cluster: (-len(cluster["task_ids"]), -cluster["max_similarity"]))
+
+        return {
+            "tasks": len(self.tasks),
+            "threshold": threshold,
+            "bands": bands,
+            "rows": rows,
+            "compared_pairs": compared,
+            "verified_pairs": sum(count for count, _ in stats.values()),
+            "clusters": clusters,
+        }
+
+    def _format_cluster(self, positions: List[int], pair_count: int, pairs: List[Tuple[float, int, int]]) -> Dict:
+        """Describe one cluster for JSON output.
+
+        Args:
+            positions: Task positions in the cluster
+            pair_count: Number of verified pairs that joined the cluster
+            pairs: Verified (similarity, position, position) pairs kept for reporting
+        """
+        positions = sorted(positions)
+        pairs = sorted(pairs, key=lambda pair: (-pair[0], pair[1], pair[2]))[: TaskAnalyzerConfig.MAX_REPORTED_PAIRS]
+
+        return {
+            "task_ids": [self.tasks[position]["id"] for position in positions],
+            "tasks": [
+                {
+                    "id": self.tasks[position]["id"],
+                    "title": self.tasks[position]["title"],
+                    "status": self.tasks[position]["status"],
+                }
+                for position in positions
+            ],
+            "max_similarity": round(pairs[0][0], 3),
+            "pair_count": pair_count,
+            "pairs": [
+                {"a": self.tasks[first]["id"], "b": self.tasks[second]["id"], "similarity": round(similarity, 3)}
+                for similarity, first, second in pairs
+            ],
+        }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""
+Task ID allocation with a cached high-water mark
+
+Task IDs are TASK-<number> with at least three digits (TASK-007, TASK-999,
+TASK-1000). The next ID is one past the highest number seen in tasks.md and
+the archive, or one past the last reserved ID, whichever is larger.
+
+The mark is kept in .agent/.cache/ids.<fingerprint> with each file's size,
+mtime and content digest:
+- file unchanged (size + mtime) → no read at all
+- file only grew (digest of its first <old size> bytes still matches) → hash
+  the old contents, regex-scan just the appended tail
+- anything else (including same-length edits anywhere) → full rescan of that file
+
+Peeking (the default) never burns an ID: an aborted /task:add leaves the
+mark where it was. Pass --reserve when the task is actually written, so a
+concurrent allocation moves past it before tasks.md shows the new header.
+
+Usage:
+    task_ids.py next <tasks_file_path> [--archive=<archive_path>] [--reserve]
+"""
+
+import hashlib
+import json
+import mmap
+from pathlib import Path
+import re
+import sys
+from typing import Dict, Optional, Tuple
+
+from task_cache import get_cache_path, read_cache, write_cache
+
+
+TASK_ID_WIDTH = 3
+TASK_ID_NUMBER_PATTERN = re.compile(rb"^##\s+\[TASK-(\d+)\]", re.MULTILINE)
+ARCHIVE_FILE_NAME = "tasks-archive.md"
+
+# Bytes before the previous end of file re-scanned after an append (a header may straddle it)
+TAIL_RESCAN_BYTES = 256
+
+
+def format_task_id(number: int) -> str:
+    """Format a task number as an ID, zero-padded to the historic three digits (e.g., 7 → TASK-007)."""
+    return f"TASK-{number:0{TASK_ID_WIDTH}d}"
+
+
+def parse_task_number(task_id: str) -> Optional[int]:
+    """Return the numeric part of a task ID, or None if it isn't TASK-<digits>."""
+    match = re.fullmatch(r"TASK-(\d+)", task_id)
+    return int(match.group(1)) if match else None
+
+
+def task_id_sort_key(task_id: str) -> Tuple[int, int, str]:
+    """Sort key ordering task IDs numerically (TASK-999 before TASK-1000), other IDs last."""
+    number = parse_task_number(task_id)
+    return (0, number, task_id) if number is not None else (1, 0, task_id)
+
+
+def scan_max_task_number(data, start: int = 0) -> int:
+    """
+    Return the highest task number among ## [TASK-N] headers in data[start:].
+
+    Args:
+        data: bytes-like file contents (bytes or mmap)
+        start: Offset to start scanning from
+
+    Returns:
+        Highest task number found, or 0 if none
+    """
+    highest = 0
+    for match in TASK_ID_NUMBER_PATTERN.finditer(data, start):
+        number = int(match.group(1))
+        if number > highest:
+            highest = number
+    return highest
+
+
+def _refresh_file_mark(path: Path, mark: Optional[Dict]) -> Dict:
+    """
+    Bring one file's mark up to date, reading as little of the file as possible.
+
+    Args:
+        path: Task markdown file
+        mark: Previous mark dict ({"size", "mtime_ns", "digest", "max"}) or None
+
+    Returns:
+        Current mark dict (max is 0 for missing or empty files)
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {"size": 0, "mtime_ns": 0, "digest": "", "max": 0}
+
+    if mark is not None and mark["size"] == stat.st_size and mark["mtime_ns"] == stat.st_mtime_ns:
+        return mark
+
+    if stat.st_size == 0:
+        return {"size": 0, "mtime_ns": stat.st_mtime_ns, "digest": "", "max": 0}
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        highest = 0
+        scan_from = 0
+        digest = hashlib.sha1()
+
+        if mark is not None and mark.get("digest") and 0 < mark["size"] < len(view):
+            # Hashing runs ~10x faster than the header scan, so verifying the old contents stays cheap
+            digest.update(view[: mark["size"]])
+            if digest.hexdigest() == mark["digest"]:
+                # Append-only change: previous contents are still in place
+                highest = mark["max"]
+                scan_from = max(0, mark["size"] - TAIL_RESCAN_BYTES)
+            digest.update(view[mark["size"] :])
+        else:
+            digest.update(view)
+
+        highest = max(highest, scan_max_task_number(mapped, scan_from))
+
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest.hexdigest(), "max": highest}
+
+
+def next_task_id(tasks_file: Path, archive_file: Optional[Path] = None, reserve: bool = False) -> str:
+    """
+    Return the next free task ID.
+
+    Args:
+        tasks_file: Path to .agent/tasks.md
+        archive_file: Path to the archive (defaults to tasks-archive.md next to tasks_file)
+        reserve: Record the returned ID as used so the next call moves past it
+            (only when the task is being written; by default the ID is just peeked)
+
+    Returns:
+        Task ID string (e.g., "TASK-607")
+    """
+    if archive_file is None:
+        archive_file = tasks_file.parent / ARCHIVE_FILE_NAME
+
+    cache_path = get_cache_path(tasks_file, "ids")
+    entry = read_cache(cache_path) or {}
+    previous = entry.get("files", {})
+
+    files = {}
+    for path in (tasks_file, archive_file):
+        key = str(path.resolve())
+        files[key] = _refresh_file_mark(path, previous.get(key))
+
+    highest = max([entry.get("reserved", 0)] + [mark["max"] for mark in files.values()])
+    number = highest + 1
+
+    if reserve or files != previous:
+        write_cache(cache_path, {"files": files, "reserved": number if reserve else entry.get("reserved", 0)})
+
+    return format_task_id(number)
+
+
+def main():
+    """CLI interface for task ID allocation"""
+    if len(sys.argv) < 3 or sys.argv[1] != "next":
+        print("Usage: task_ids.py next <tasks_file_path> [--archive=<archive_path>] [--reserve]", file=sys.stderr)
+        sys.exit(1)
+
+    tasks_file = Path(sys.argv[2])
+    archive_file = None
+    reserve = False
+
+    for arg in sys.argv[3:]:
+        if arg.startswith("--archive="):
+            archive_file = Path(arg.split("=", 1)[1])
+        elif arg == "--reserve":
+            reserve = True
+        elif arg == "--peek":
+            reserve = False
+
+    print(json.dumps({"task_id": next_task_id(tasks_file, archive_file, reserve=reserve)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,728 @@
+#!/usr/bin/env python
+"""
+Persistent inverted index for task search
+
+Maps every whitespace token of a task's lowercased title and description to the
+positions (in file order) of the tasks containing it. The index lives at
+.agent/.cache/search.<fingerprint> and is rebuilt whenever tasks.md changes.
+
+Tokens are whitespace-delimited because the search scorer uses substring tests:
+a query word (which never contains whitespace) occurs in a text exactly when it
+occurs inside one of that text's tokens. Candidate lookup therefore scans the
+vocabulary, not the tasks.
+
+A second entry (.agent/.cache/bm25.<fingerprint>) holds per-field term
+statistics for BM25 ranking: word-term postings with term frequencies, document
+frequencies and precomputed length norms for the title and description fields.
+It is only built and loaded when BM25 ranking is requested.
+
+The token index also carries one bitmap (a Python int, bit i = task position i)
+per distinct status, priority, category and epic value, so attribute filters are
+resolved with a few integer ANDs/ORs before any text is scored.
+
+A third entry (.agent/.cache/trigram.<fingerprint>) indexes the title vocabulary
+by character trigrams for typo-tolerant (--fuzzy) search.
+
+A fourth entry (.agent/.cache/vectors.<fingerprint>) encodes the same title and
+description tokens as sparse incidence matrices, plus per-task priority boosts
+and completion flags, for the optional NumPy scorer (see task_vectors).
+
+A fifth entry (.agent/.cache/complete.<fingerprint>) serves title/ID typeahead:
+sorted (term, position) arrays searched with bisect, one per priority tier with
+active tasks before completed ones, plus the few fields a completion displays,
+so a fresh entry answers without loading tasks.md at all.
+"""
+
+from array import array
+from bisect import bisect_left
+import math
+import os
+from pathlib import Path
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config import TaskSearchConfig
+from markdown_parser import Task
+from task_cache import get_cache_path, is_fresh, load_cached_tasks, read_cache, write_cache
+from task_vectors import IncidenceMatrix, encode_incidence
+
+
+INDEX_PREFIX = "search"
+BM25_INDEX_PREFIX = "bm25"
+BM25_FIELDS = ("title", "description")
+TRIGRAM_INDEX_PREFIX = "trigram"
+VECTOR_INDEX_PREFIX = "vectors"
+COMPLETION_INDEX_PREFIX = "complete"
+# Hyphenated words and task IDs (task-042) stay whole so they complete as typed
+COMPLETION_TERM_PATTERN = re.compile(r"\w[\w-]*")
+# Completion tiers, best first; unknown priorities rank after these
+COMPLETION_PRIORITIES = ("critical", "high", "medium", "low")
+TERM_PATTERN = re.compile(r"\w+")
+BITMAP_FIELDS = ("status", "priority", "category", "epic")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the lowercase whitespace tokens used by the index."""
+    return text.lower().split()
+
+
+def priority_boost(task: Dict) -> int:
+    """Return the priority component of a relevance score (high/critical +5, medium +2)."""
+    priority = task["priority"].lower()
+    if priority in ["critical", "high"]:
+        return 5
+    if priority == "medium":
+        return 2
+    return 0
+
+
+def tokenize_terms(text: str) -> List[str]:
+    """Split text into the lowercase word terms used for BM25 (punctuation dropped)."""
+    return TERM_PATTERN.findall(text.lower())
+
+
+def build_search_index(tasks: Iterable[Task]) -> Dict:
+    """
+    Build the inverted index for tasks in file order.
+
+    Args:
+        tasks: Task records (positions in this sequence become the postings)
+
+    Returns:
+        Dict with "count" (number of tasks), "postings" (token → list of task
+        positions) and "bitmaps" (field → normalized value → bitmap of positions)
+    """
+    postings: Dict[str, List[int]] = {}
+    value_positions: Dict[str, Dict[str, List[int]]] = {field: {} for field in BITMAP_FIELDS}
+    count = 0
+
+    for position, task in enumerate(tasks):
+        for token in set(tokenize(task["title"])).union(tokenize(task["description"])):
+            postings.setdefault(token, []).append(position)
+        for field in BITMAP_FIELDS:
+            value_positions[field].setdefault(normalize_value(task[field]), []).append(position)
+        count = position + 1
+
+    bitmaps = {
+        field: {value: positions_to_bitmap(positions) for value, positions in values.items()}
+        for field, values in value_positions.items()
+    }
+
+    return {"count": count, "postings": postings, "bitmaps": bitmaps}
+
+
+def normalize_value(value: Optional[str]) -> str:
+    """Normalize a field value for filtering (case-insensitive, surrounding whitespace ignored, None → "")."""
+    return (value or "").strip().lower()
+
+
+def positions_to_bitmap(positions: Iterable[int]) -> int:
+    """Pack task positions into an int bitmap (bit i set = position i)."""
+    positions = list(positions)
+    if not positions:
+        return 0
+
+    bits = bytearray(max(positions) // 8 + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def bitmap_positions(bitmap: int) -> List[int]:
+    """Unpack an int bitmap into ascending task positions."""
+    positions = []
+    bits = bin(bitmap)[:1:-1]  # least significant bit first
+    position = bits.find("1")
+    while position != -1:
+        positions.append(position)
+        position = bits.find("1", position + 1)
+    return positions
+
+
+def filter_positions(
+    index: Dict, filters: Optional[Dict[str, Iterable[str]]] = None, include_completed: bool = True
+) -> Optional[List[int]]:
+    """
+    Resolve attribute filters to the task positions that pass them.
+
+    Values for one field are OR'ed, fields are AND'ed. Completed tasks are
+    excluded unless include_completed is set or a status filter is given (an
+    explicit status filter decides on its own).
+
+    Args:
+        index: Index dict from load_search_index
+        filters: Field → accepted values (e.g., {"priority": ["high", "critical"], "epic": ["Auth"]})
+        include_completed: Keep completed tasks when no status filter is given
+
+    Returns:
+        Ascending positions, or None when nothing is filtered out
+
+    Raises:
+        ValueError: If a filter names an unknown field
+    """
+    filters = {field: values for field, values in (filters or {}).items() if values}
+    unknown = set(filters) - set(BITMAP_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown filter field(s): {', '.join(sorted(unknown))} (expected {', '.join(BITMAP_FIELDS)})")
+
+    if not filters and include_completed:
+        return None
+
+    mask = (1 << index["count"]) - 1
+    for field, values in filters.items():
+        field_bitmaps = index["bitmaps"][field]
+        accepted = 0
+        for value in values:
+            accepted |= field_bitmaps.get(normalize_value(value), 0)
+        mask &= accepted
+
+    if "status" not in filters and not include_completed:
+        mask &= ~index["bitmaps"]["status"].get("completed", 0)
+
+    return bitmap_positions(mask)
+
+
+def load_search_index(tasks_file: Path, tasks: List[Task], stat: Optional[os.stat_result] = None) -> Dict:
+    """
+    Load the inverted index for tasks_file, rebuilding it when the file changed.
+
+    Args:
+        tasks_file: Path to tasks.md
+        tasks: Tasks as loaded from tasks_file (used for rebuilds)
+        stat: File stat taken before tasks were loaded; stamping the index with it
+            means a file rewritten mid-load is re-indexed on the next call
+
+    Returns:
+        Index dict as produced by build_search_index
+    """
+    if stat is None:
+        stat = tasks_file.stat()
+
+    cache_path = get_cache_path(tasks_file, INDEX_PREFIX)
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat) and entry["count"] == len(tasks):
+        return entry
+
+    entry = build_search_index(tasks)
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    write_cache(cache_path, entry)
+
+    return entry
+
+
+def find_candidates(index: Dict, query_words: List[str]) -> Set[int]:
+    """
+    Return positions of tasks whose title or description contains any query word.
+
+    Args:
+        index: Index dict from load_search_index
+        query_words: Lowercased query words
+
+    Returns:
+        Set of task positions
+    """
+    candidates: Set[int] = set()
+    words = set(query_words)
+
+    for token, positions in index["postings"].items():
+        for word in words:
+            if word in token:
+                candidates.update(positions)
+                break
+
+    return candidates
+
+
+def _bm25_params() -> tuple:
+    """Return the parameters baked into precomputed BM25 norms."""
+    return (TaskSearchConfig.BM25_K1, TaskSearchConfig.BM25_B)
+
+
+def build_bm25_index(tasks: List[Task]) -> Dict:
+    """
+    Build per-field BM25 statistics for tasks in file order.
+
+    Args:
+        tasks: Task records (positions in this list become the postings)
+
+    Returns:
+        Dict with:
+        - count: number of tasks
+        - df: term → number of tasks containing it in any field
+        - fields: field → {"postings": term → (positions, term frequencies),
+          "norms": per-task k1 * (1 - b + b * length / average_length)}
+        - params: (k1, b) used for the norms
+    """
+    k1, b = _bm25_params()
+    df: Dict[str, int] = {}
+    fields = {}
+    seen: List[Set[str]] = [set() for _ in tasks]
+
+    for field in BM25_FIELDS:
+        postings: Dict[str, tuple] = {}
+        lengths = []
+
+        for position, task in enumerate(tasks):
+            terms = tokenize_terms(task[field])
+            lengths.append(len(terms))
+
+            frequencies: Dict[str, int] = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+
+            for term, frequency in frequencies.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = ([], [])
+                entry[0].append(position)
+                entry[1].append(frequency)
+                seen[position].add(term)
+
+        average = (sum(lengths) / len(lengths)) if lengths else 0.0
+        norms = [k1 * (1 - b + b * (length / average if average else 0.0)) for length in lengths]
+        fields[field] = {"postings": postings, "norms": norms}
+
+    for terms in seen:
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+
+    return {"count": len(tasks), "df": df, "fields": fields, "params": _bm25_params()}
+
+
+def load_bm25_index(tasks_file: Path, tasks: List[Task], stat: Optional[os.stat_result] = None) -> Dict:
+    """
+    Load BM25 statistics for tasks_file, rebuilding them when the file or parameters changed.
+
+    Args:
+        tasks_file: Path to tasks.md
+        tasks: Tasks as loaded from tasks_file (used for rebuilds)
+        stat: File stat taken before tasks were loaded (see load_search_index)
+
+    Returns:
+        Index dict as produced by build_bm25_index
+    """
+    if stat is None:
+        stat = tasks_file.stat()
+
+    cache_path = get_cache_path(tasks_file, BM25_INDEX_PREFIX)
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat) and entry["count"] == len(tasks) and tuple(entry["params"]) == _bm25_params():
+        return entry
+
+    entry = build_bm25_index(tasks)
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    write_cache(cache_path, entry)
+
+    return entry
+
+
+def bm25_scores(index: Dict, query: str, weights: Optional[Dict[str, float]] = None) -> Dict[int, float]:
+    """
+    Accumulate BM25 scores over the postings of each query term.
+
+    Each field contributes weight * idf * tf * (k1 + 1) / (tf + norm), where norm is
+    the precomputed length norm of that task's field.
+
+    Args:
+        index: Index dict from load_bm25_index
+        query: Search query string
+        weights: Field weights (defaults to TaskSearchConfig title/description weights)
+
+    Returns:
+        Dict mapping task position to BM25 score (only tasks matching a term)
+    """
+    if weights is None:
+        weights = {
+            "title": TaskSearchConfig.BM25_TITLE_WEIGHT,
+            "description": TaskSearchConfig.BM25_DESCRIPTION_WEIGHT,
+        }
+
+    k1 = index["params"][0]
+    count = index["count"]
+    scores: Dict[int, float] = {}
+
+    for term in set(tokenize_terms(query)):
+        df = index["df"].get(term)
+        if not df:
+            continue
+
+        idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+
+        for field, weight in weights.items():
+            field_index = index["fields"][field]
+            entry = field_index["postings"].get(term)
+            if entry is None:
+                continue
+
+            norms = field_index["norms"]
+            factor = weight * idf * (k1 + 1)
+            for position, frequency in zip(*entry):
+                scores[position] = scores.get(position, 0.0) + factor * frequency / (frequency + norms[position])
+
+    return scores
+
+
+def trigrams(token: str) -> Set[str]:
+    """Return the character trigrams of a token padded with word boundaries ("$auth$" → "$au", ..., "th$")."""
+    padded = f"${token}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def build_trigram_index(tasks: List[Task]) -> Dict:
+    """
+    Build the trigram index over the title vocabulary.
+
+    Args:
+        tasks: Task records (positions in this list become the postings)
+
+    Returns:
+        Dict with:
+        - count: number of tasks
+        - tokens: distinct title terms
+        - postings: per token, positions of tasks whose title contains it
+        - trigrams: trigram → ids (into tokens) of terms containing it
+    """
+    token_ids: Dict[str, int] = {}
+    postings: List[List[int]] = []
+
+    for position, task in enumerate(tasks):
+        for term in set(tokenize_terms(task["title"])):
+            token_id = token_ids.get(term)
+            if token_id is None:
+                token_id = token_ids[term] = len(postings)
+                postings.append([])
+            postings[token_id].append(position)
+
+    grams: Dict[str, List[int]] = {}
+    for term, token_id in token_ids.items():
+        for gram in trigrams(term):
+            grams.setdefault(gram, []).append(token_id)
+
+    return {"count": len(tasks), "tokens": list(token_ids), "postings": postings, "trigrams": grams}
+
+
+def load_trigram_index(tasks_file: Path, tasks: List[Task], stat: Optional[os.stat_result] = None) -> Dict:
+    """
+    Load the title trigram index for tasks_file, rebuilding it when the file changed.
+
+    Args:
+        tasks_file: Path to tasks.md
+        tasks: Tasks as loaded from tasks_file (used for rebuilds)
+        stat: File stat taken before tasks were loaded (see load_search_index)
+
+    Returns:
+        Index dict as produced by build_trigram_index
+    """
+    if stat is None:
+        stat = tasks_file.stat()
+
+    cache_path = get_cache_path(tasks_file, TRIGRAM_INDEX_PREFIX)
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat) and entry["count"] == len(tasks):
+        return entry
+
+    entry = build_trigram_index(tasks)
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    write_cache(cache_path, entry)
+
+    return entry
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Edit distance between a and b, or None if it exceeds max_distance.
+
+    Counts insertions, deletions, substitutions and adjacent transpositions
+    ("cahce" → "cache" is one edit), i.e. optimal string alignment distance.
+    Only the diagonal band of width 2 * max_distance + 1 is computed, and the
+    computation stops as soon as every cell in a row exceeds max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+
+    over = max_distance + 1
+    before_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= max_distance else over
+        row_min = current[0]
+
+        for j in range(low, high + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before_previous[j - 2] + 1)
+            current[j] = value if value < over else over
+            if current[j] < row_min:
+                row_min = current[j]
+
+        if row_min > max_distance:
+            return None
+        before_previous, previous = previous, current
+
+    return previous[len(b)] if previous[len(b)] <= max_distance else None
+
+
+def allowed_edits(word: str) -> int:
+    """Return the edit budget for a query word (longer words tolerate more typos)."""
+    return max(0, min(TaskSearchConfig.FUZZY_MAX_DISTANCE, (len(word) - 1) // TaskSearchConfig.FUZZY_CHARS_PER_EDIT))
+
+
+def fuzzy_term_matches(index: Dict, word: str) -> Dict[int, int]:
+    """
+    Find title terms within the edit budget of a query word.
+
+    Candidates come from trigram overlap: each edit destroys at most four of the
+    word's trigrams (an adjacent transposition touches four, other edits three), so
+    a term within d edits must share at least len(trigrams(word)) - 4 * d of them.
+    Terms sharing no trigram at all are never considered, so very short words
+    with every trigram edited away (e.g. "abcd" vs "acbd") are not matched. Survivors are
+    verified with bounded_edit_distance. Terms that contain the word as a substring
+    match with distance 0, as in the plain scorer: a word of three or more characters
+    shares its first inner trigram with every such term, and shorter words (whose
+    edit budget is zero) are checked against the whole vocabulary instead.
+
+    Args:
+        index: Index dict from load_trigram_index
+        word: Lowercased query word
+
+    Returns:
+        Dict mapping token id to edit distance
+    """
+    tokens = index["tokens"]
+    if len(word) < 3:
+        return {token_id: 0 for token_id, token in enumerate(tokens) if word in token}
+
+    max_distance = allowed_edits(word)
+    word_grams = trigrams(word)
+    min_shared = max(1, len(word_grams) - 4 * max_distance)
+
+    shared: Dict[int, int] = {}
+    for gram in word_grams:
+        for token_id in index["trigrams"].get(gram, ()):
+            shared[token_id] = shared.get(token_id, 0) + 1
+
+    matches: Dict[int, int] = {}
+
+    for token_id, count in shared.items():
+        token = tokens[token_id]
+        if word in token:
+            matches[token_id] = 0
+        elif count >= min_shared:
+            distance = bounded_edit_distance(word, token, max_distance)
+            if distance is not None:
+                matches[token_id] = distance
+
+    return matches
+
+
+def build_vector_index(tasks: List[Task]) -> Dict:
+    """
+    Encode tasks for the NumPy relevance scorer (pure Python; NumPy is only needed to load it).
+
+    Args:
+        tasks: Task records (positions in this list become matrix rows)
+
+    Returns:
+        Dict with "count", "title" and "description" (encode_incidence of the
+        whitespace tokens), "boost" (int8 priority boost per task) and
+        "completed" (one 0/1 byte per task)
+    """
+    return {
+        "count": len(tasks),
+        "title": encode_incidence(tokenize(task["title"]) for task in tasks),
+        "description": encode_incidence(tokenize(task["description"]) for task in tasks),
+        "boost": array("b", [priority_boost(task) for task in tasks]).tobytes(),
+        "completed": bytes(task["status"] == "completed" for task in tasks),
+    }
+
+
+def load_vector_index(tasks_file: Path, tasks: List[Task], stat: Optional[os.stat_result] = None) -> Dict:
+    """
+    Load the vector index for tasks_file as NumPy views, rebuilding it when the file changed.
+
+    Requires NumPy (check task_vectors.use_vectors first).
+
+    Args:
+        tasks_file: Path to tasks.md
+        tasks: Tasks as loaded from tasks_file (used for rebuilds)
+        stat: File stat taken before tasks were loaded (see load_search_index)
+
+    Returns:
+        Dict with "count", "title"/"description" (IncidenceMatrix), "boost"
+        (int8 array) and "completed" (bool array)
+    """
+    import numpy as np
+
+    if stat is None:
+        stat = tasks_file.stat()
+
+    cache_path = get_cache_path(tasks_file, VECTOR_INDEX_PREFIX)
+    entry = read_cache(cache_path)
+
+    if not is_fresh(entry, stat) or entry["count"] != len(tasks):
+        entry = build_vector_index(tasks)
+        entry["size"] = stat.st_size
+        entry["mtime_ns"] = stat.st_mtime_ns
+        write_cache(cache_path, entry)
+
+    return {
+        "count": entry["count"],
+        "title": IncidenceMatrix(entry["title"]),
+        "description": IncidenceMatrix(entry["description"]),
+        "boost": np.frombuffer(entry["boost"], dtype=np.int8),
+        "completed": np.frombuffer(entry["completed"], dtype=np.bool_),
+    }
+
+
+def completion_terms(text: str) -> List[str]:
+    """Split text into the lowercase terms used for completion (e.g., "Fix status-line" → fix, status-line)."""
+    return COMPLETION_TERM_PATTERN.findall(text.lower())
+
+
+def completion_tier(task: Dict) -> int:
+    """Return a task's completion tier: priority rank, offset past every active tier when completed."""
+    priority = normalize_value(task["priority"])
+    rank = COMPLETION_PRIORITIES.index(priority) if priority in COMPLETION_PRIORITIES else len(COMPLETION_PRIORITIES)
+    return rank + (len(COMPLETION_PRIORITIES) + 1 if task["status"] == "completed" else 0)
+
+
+def build_completion_index(tasks: List[Task]) -> Dict:
+    """
+    Build the typeahead index for tasks in file order.
+
+    Args:
+        tasks: Task records (positions in this list are stored in the entries)
+
+    Returns:
+        Dict with:
+        - count: number of tasks
+        - tasks: (id, title, status, priority) per position
+        - tiers: per completion tier, (sorted terms, positions) as parallel lists;
+          every distinct title term and the lowercased task ID is one entry
+    """
+    entries: List[List[Tuple[str, int]]] = [[] for _ in range(2 * (len(COMPLETION_PRIORITIES) + 1))]
+
+    for position, task in enumerate(tasks):
+        tier = entries[completion_tier(task)]
+        for term in set(completion_terms(task["title"])) | {task["id"].lower()}:
+            tier.append((term, position))
+
+    tiers = []
+    for tier in entries:
+        tier.sort()
+        tiers.append(([term for term, _ in tier], [position for _, position in tier]))
+
+    return {
+        "count": len(tasks),
+        "tasks": [(task["id"], task["title"], task["status"], task["priority"]) for task in tasks],
+        "tiers": tiers,
+    }
+
+
+def load_completion_index(
+    tasks_file: Path, tasks: Optional[List[Task]] = None, stat: Optional[os.stat_result] = None
+) -> Dict:
+    """
+    Load the typeahead index for tasks_file, rebuilding it when the file changed.
+
+    Args:
+        tasks_file: Path to tasks.md
+        tasks: Tasks as loaded from tasks_file, if already in memory (otherwise
+            they are only loaded when the index must be rebuilt)
+        stat: File stat taken before tasks were loaded (see load_search_index)
+
+    Returns:
+        Index dict as produced by build_completion_index
+    """
+    if stat is None:
+        stat = tasks_file.stat()
+
+    cache_path = get_cache_path(tasks_file, COMPLETION_INDEX_PREFIX)
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat) and (tasks is None or entry["count"] == len(tasks)):
+        return entry
+
+    entry = build_completion_index(tasks if tasks is not None else load_cached_tasks(tasks_file))
+    entry["size"] = stat.st_size
+    entry["mtime_ns"] = stat.st_mtime_ns
+    write_cache(cache_path, entry)
+
+    return entry
+
+
+def complete_prefix(
+    index: Dict, text: str, limit: int = 5, include_completed: bool = False, scan_limit: int = 0
+) -> Tuple[List[Tuple[int, str]], bool]:
+    """
+    Find tasks whose title terms or ID start with the typed words, best tier first.
+
+    The longest typed word is looked up with bisect in each tier; every other
+    word must prefix some term of the same task. Within a tier, completions come
+    in term order (shorter and alphabetically earlier terms first).
+
+    Args:
+        index: Index dict from load_completion_index
+        text: Typed text (e.g., "cach", "TASK-04", "fix sess")
+        limit: Maximum tasks to return (0 = until scan_limit)
+        include_completed: Also complete completed tasks (after every active one)
+        scan_limit: Maximum index entries examined (0 = unbounded); bounds latency
+            for very unselective input
+
+    Returns:
+        Tuple of ([(position, completed term)] best first, whether scan_limit cut the scan short)
+    """
+    words = completion_terms(text)
+    if not words:
+        return [], False
+
+    lookup = max(words, key=len)
+    words.remove(lookup)
+    tiers = index["tiers"] if include_completed else index["tiers"][: len(COMPLETION_PRIORITIES) + 1]
+
+    completions: List[Tuple[int, str]] = []
+    seen: Set[int] = set()
+    scanned = 0
+
+    for terms, positions in tiers:
+        entry = bisect_left(terms, lookup)
+        while entry < len(terms) and terms[entry].startswith(lookup):
+            if scan_limit and scanned >= scan_limit:
+                return completions, True
+            scanned += 1
+
+            position = positions[entry]
+            if position not in seen:
+                seen.add(position)
+                task_id, title, _, _ = index["tasks"][position]
+                task_terms = completion_terms(title) + [task_id.lower()] if words else []
+                if all(any(term.startswith(word) for term in task_terms) for word in words):
+                    completions.append((position, terms[entry]))
+                    if limit > 0 and len(completions) >= limit:
+                        return completions, False
+            entry += 1
+
+    return completions, False
+
+
+# Index kind → loader(tasks_file, tasks, stat); used by callers that keep indexes warm
+INDEX_LOADERS = {
+    INDEX_PREFIX: load_search_index,
+    BM25_INDEX_PREFIX: load_bm25_index,
+    TRIGRAM_INDEX_PREFIX: load_trigram_index,
+    VECTOR_INDEX_PREFIX: load_vector_index,
+    COMPLETION_INDEX_PREFIX: load_completion_index,
+}
@@ -3,11 +3,21 @@
 
 Handles finding existing tasks that match keywords semantically.
 Extracted from TaskAnalyzer to follow Single Responsibility Principle.
+
+A keyword → task postings index and lowercased task text are built once at
+construction, so each query only scores tasks sharing at least one keyword:
+a task with no shared keyword has Jaccard similarity 0 and can never pass
+SIMILARITY_THRESHOLD, boosted or not.
+
+add_task/remove_task keep the index current one task at a time. Removed
+tasks leave an empty slot (no keywords, so they never match) until more than
+half of the slots are empty, when the index is compacted.
 """
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from config import TaskAnalyzerConfig
+from task_vectors import IncidenceMatrix, encode_incidence, top_positions, use_vectors
 
 
 class TaskMatcher:
@@ -20,34 +30,92 @@ class TaskMatcher:
             tasks: List of task dictionaries
             keywords_by_task: Dict mapping task_id → extracted keywords
         """
-        self.tasks = tasks
         self.keywords_by_task = keywords_by_task
 
+        # NumPy backend state, built on first use (see _find_matches_vectorized)
+        self._vectors: Optional[IncidenceMatrix] = None
+        self._sizes = None
+        self._deleted = None
+
+        self._build((task, keywords_by_task.get(task["id"], [])) for task in tasks)
+
+    def add_task(self, task: Dict, keywords: List[str]) -> None:
+        """Add a task, or replace the task with the same ID in place, without re-indexing the others.
+
+        Args:
+            task: Task dictionary
+            keywords: Keywords extracted for the task
+        """
+        position = self._positions.get(task["id"])
+        if position is None:
+            self._extend([(task, keywords)])
+        else:
+            self._unindex(position)
+            self.tasks[position] = task
+            self._index(position, task, keywords)
+
+        self._vectors = None
+
+    def remove_task(self, task_id: str) -> bool:
+        """Remove a task by ID without re-indexing the others.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            True if the task was present
+        """
+        position = self._positions.pop(task_id, None)
+        if position is None:
+            return False
+
+        self._unindex(position)
+        self._removed.add(position)
+        self._vectors = None
+
+        if 2 * len(self._removed) > len(self.tasks):
+            self._build(
+                [
+                    (task, keyword_set)
+                    for position, (task, keyword_set) in enumerate(zip(self.tasks, self._keyword_sets))
+                    if position not in self._removed
+                ]
+            )
+        return True
+
     def find_matches(self, keywords: List[str]) -> List[Tuple[Dict, float]]:
         """Find tasks matching keywords semantically.
 
+        Uses the NumPy backend on large task lists when it is available (same results).
+
         Args:
             keywords: List of keywords to match
 
         Returns:
             List of (task, similarity_score) tuples, sorted by score descending
         """
+        if use_vectors(len(self.tasks)):
+            return self._find_matches_vectorized(keywords)
+
         scores = []
         keywords_set = set(keywords)
+        phrase = " ".join(keywords).lower()
+
+        # Only tasks sharing a keyword can score above 0; visit them in task order
+        candidates: Set[int] = set()
+        for keyword in keywords_set:
+            candidates.update(self._postings.get(keyword, ()))
 
-        for task in self.tasks:
+        for position in sorted(candidates):
+            task = self.tasks[position]
             if task.get("status") == "deleted":
                 continue
 
-            # Get task keywords
-            task_keywords = self.keywords_by_task.get(task["id"], [])
-            task_keywords_set = set(task_keywords)
-
             # Calculate Jaccard similarity
-            similarity_score = self._calculate_similarity(keywords_set, task_keywords_set)
+            similarity_score = self._calculate_similarity(keywords_set, self._keyword_sets[position])
 
             # Boost for exact phrase matches
-            if self._phrase_in_task(keywords, task):
+            if self._phrase_in_task(phrase, position):
                 similarity_score = min(1.0, similarity_score * TaskAnalyzerConfig.SIMILARITY_BOOST_MULTIPLIER)
 
             if similarity_score > TaskAnalyzerConfig.SIMILARITY_THRESHOLD:
@@ -57,6 +125,81 @@ class TaskMatcher:
         scores.sort(key=lambda x: x[1], reverse=True)
         return scores[: TaskAnalyzerConfig.TOP_N_MATCHES]
 
+    def _build(self, entries: Iterable[Tuple[Dict, Iterable[str]]]) -> None:
+        """Index (task, keywords) entries from scratch, in order."""
+        # Tasks by position, per-task keyword sets, lowercased text and keyword → task positions
+        self.tasks: List[Dict] = []
+        self._keyword_sets: List[Set[str]] = []
+        self._lowered_text: List[Tuple[str, str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._positions: Dict[str, int] = {}
+        self._removed: Set[int] = set()
+
+        self._extend(entries)
+
+    def _extend(self, entries: Iterable[Tuple[Dict, Iterable[str]]]) -> None:
+        """Index (task, keywords) entries at new positions after all others."""
+        for task, keywords in entries:
+            position = len(self.tasks)
+            task_keywords = set(keywords)
+            self._positions[task["id"]] = position
+            self.tasks.append(task)
+            self._keyword_sets.append(task_keywords)
+            self._lowered_text.append((task.get("title", "").lower(), task.get("description", "").lower()))
+            for keyword in task_keywords:
+                self._postings.setdefault(keyword, []).append(position)
+
+    def _index(self, position: int, task: Dict, keywords: Iterable[str]) -> None:
+        """Fill an (empty) position with a task's keywords and text."""
+        task_keywords = set(keywords)
+        self._keyword_sets[position] = task_keywords
+        self._lowered_text[position] = (task.get("title", "").lower(), task.get("description", "").lower())
+        for keyword in task_keywords:
+            self._postings.setdefault(keyword, []).append(position)
+
+    def _unindex(self, position: int) -> None:
+        """Empty a position: drop its postings, keywords and text."""
+        for keyword in self._keyword_sets[position]:
+            postings = self._postings[keyword]
+            postings.remove(position)
+            if not postings:
+                del self._postings[keyword]
+
+        self._keyword_sets[position] = set()
+        self._lowered_text[position] = ("", "")
+
+    def _find_matches_vectorized(self, keywords: List[str]) -> List[Tuple[Dict, float]]:
+        """Compute find_matches with array operations over a task × keyword incidence matrix.
+
+        Jaccard similarity for every task is |K ∩ T| / (|K| + |T| - |K ∩ T|); the phrase
+        check only runs on tasks sharing at least one keyword (others score 0 either way).
+
+        Args:
+            keywords: List of keywords to match
+
+        Returns:
+            List of (task, similarity_score) tuples, sorted by score descending
+        """
+        import numpy as np
+
+        if self._vectors is None:
+            self._vectors = IncidenceMatrix(encode_incidence(self._keyword_sets))
+            self._sizes = self._vectors.row_sizes()
+            self._deleted = np.array([task.get("status") == "deleted" for task in self.tasks], dtype=bool)
+
+        shared = self._vectors.shared_term_counts(keywords)
+        union = len(set(keywords)) + self._sizes - shared
+        scores = np.divide(shared, union, out=np.zeros(len(self.tasks)), where=union > 0)
+
+        phrase = " ".join(keywords).lower()
+        for position in np.flatnonzero(shared).tolist():
+            if self._phrase_in_task(phrase, position):
+                scores[position] = min(1.0, scores[position] * TaskAnalyzerConfig.SIMILARITY_BOOST_MULTIPLIER)
+
+        matches = np.flatnonzero((scores > TaskAnalyzerConfig.SIMILARITY_THRESHOLD) & ~self._deleted)
+        ranked = top_positions(scores, matches, TaskAnalyzerConfig.TOP_N_MATCHES)
+        return [(self.tasks[position], score) for position, score in zip(ranked.tolist(), scores[ranked].tolist())]
+
     def _calculate_similarity(self, keywords_set: Set[str], task_keywords_set: Set[str]) -> float:
         """Calculate Jaccard similarity between two keyword sets.
 
@@ -76,17 +219,15 @@ class TaskMatcher:
 
         return len(matches) / len(union)
 
-    def _phrase_in_task(self, keywords: List[str], task: Dict) -> bool:
+    def _phrase_in_task(self, phrase: str, position: int) -> bool:
         """Check if phrase appears verbatim in task.
 
         Args:
-            keywords: List of keywords forming the phrase
-            task: Task dictionary
+            phrase: Lowercased keywords joined with spaces
+            position: Task position in self.tasks
 
         Returns:
             True if phrase found in title or description
         """
-        phrase = " ".join(keywords).lower()
-        title = task.get("title", "").lower()
-        description = task.get("description", "").lower()
+        title, description = self._lowered_text[position]
         return phrase in title or phrase in description
@@ -5,12 +5,132 @@ Handles parsing, extracting, and populating task.md sections
 Supports 7-section progressive structure with full agent integration
 """
 
+import bisect
 from datetime import datetime
 import json
+import mmap
 from pathlib import Path
 import re
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+from task_cache import atomic_write_bytes, get_cache_path, is_fresh, read_cache, write_cache
+
+
+# Section boundaries for extract_task_section: ## [TASK-XXX] header up to the next --- line
+SECTION_HEADER_PATTERN = re.compile(rb"^##\s+\[([^\]\n]+)\]\s+", re.MULTILINE)
+SECTION_SEPARATOR_PATTERN = re.compile(rb"^---\s*$", re.MULTILINE)
+
+
+def build_section_index(data: Union[bytes, mmap.mmap]) -> Dict[str, Tuple[int, int]]:
+    """
+    Scan tasks.md bytes once and map each task ID to its section byte range
+
+    Mirrors extract_task_section semantics: a section runs from its
+    ## [TASK-XXX] header to the first following --- line (exclusive), and the
+    first occurrence of a task ID wins.
+
+    Args:
+        data: File contents as bytes or a memory map
+
+    Returns:
+        Dict mapping task ID to (start, end) byte offsets
+    """
+    separators = [match.start() for match in SECTION_SEPARATOR_PATTERN.finditer(data)]
+    index = {}
+
+    for match in SECTION_HEADER_PATTERN.finditer(data):
+        task_id = match.group(1).decode("utf-8", "replace")
+        if task_id in index:
+            continue
+
+        position = bisect.bisect_right(separators, match.end())
+        if position < len(separators):
+            index[task_id] = (match.start(), separators[position])
+
+    return index
+
+
+def save_section_index(tasks_file: Path, sections: Dict[str, Tuple[int, int]]) -> None:
+    """Stamp a section index with the current size and mtime of tasks.md and persist it"""
+    stat = tasks_file.stat()
+    write_cache(
+        get_cache_path(tasks_file, "sections"),
+        {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sections": sections},
+    )
+
+
+def load_section_index(tasks_file: Path, data: Optional[bytes] = None) -> Dict[str, Tuple[int, int]]:
+    """
+    Load the sidecar section offset index, rebuilding it only when tasks.md changed
+
+    The index lives at .agent/.cache/sections.<fingerprint> and is stamped with
+    the file size and mtime.
+
+    Args:
+        tasks_file: Path to .agent/tasks.md
+        data: Optional file contents already in memory (avoids a second read on rebuild)
+
+    Returns:
+        Dict mapping task ID to (start, end) byte offsets
+    """
+    stat = tasks_file.stat()
+    cache_path = get_cache_path(tasks_file, "sections")
+    entry = read_cache(cache_path)
+
+    if is_fresh(entry, stat):
+        return entry["sections"]
+
+    if data is not None:
+        sections = build_section_index(data)
+    elif stat.st_size == 0:
+        sections = {}
+    else:
+        with tasks_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            sections = build_section_index(mapped)
+
+    write_cache(cache_path, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sections": sections})
+    return sections
+
+
+def extract_task_sections(tasks_file: Path, task_ids: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Extract many task sections from tasks.md in one pass over the offset index
+
+    Each lookup is a slice of a memory-mapped file at the indexed byte range.
+
+    Args:
+        tasks_file: Path to .agent/tasks.md
+        task_ids: Task IDs to resolve (e.g., ["TASK-001", "TASK-002"])
+
+    Returns:
+        Dict mapping each requested task ID to its section text, or None if not found
+    """
+    sections = dict.fromkeys(task_ids)
+
+    if not tasks_file.exists() or tasks_file.stat().st_size == 0:
+        return sections
+
+    index = load_section_index(tasks_file)
+
+    with tasks_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for task_id in task_ids:
+            span = index.get(task_id)
+            if span is None:
+                continue
+
+            # Guard against a file rewritten between stat and mmap: re-index in place
+            header = SECTION_HEADER_PATTERN.match(mapped, span[0])
+            if header is None or header.group(1).decode("utf-8", "replace") != task_id:
+                index = build_section_index(mapped)
+                span = index.get(task_id)
+                if span is None:
+                    continue
+
+            start, end = span
+            sections[task_id] = mapped[start:end].decode("utf-8").replace("\r\n", "\n")
+
+    return sections
 
 
 def extract_task_section(tasks_file: Path, task_id: str) -> Optional[str]:
@@ -25,16 +145,7 @@ def extract_task_section(tasks_file: Path, task_id: str) -> Optional[str]:
     Returns:
         Full task section text, or None if not found
     """
-    if not tasks_file.exists():
-        return None
-
-    content = tasks_file.read_text()
-
-    # Pattern: ## [TASK-XXX] ... to next ---
-    pattern = rf"^##\s+\[{re.escape(task_id)}\]\s+.+?(?=^---\s*$)"
-    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-
-    return match.group(0) if match else None
+    return extract_task_sections(tasks_file, [task_id])[task_id]
 
 
 def parse_task_metadata(task_section: str) -> Dict[str, str]:
@@ -51,7 +162,7 @@ def parse_task_metadata(task_section: str) -> Dict[str, str]:
     metadata = {}
 
     # Extract header: ## [TASK-XXX] title
-    header_match = re.match(r"^##\s+\[TASK-(\d{3})\]\s+(.+)$", lines[0])
+    header_match = re.match(r"^##\s+\[TASK-(\d+)\]\s+(.+)$", lines[0])
     if header_match:
         metadata["task_id"] = f"TASK-{header_match.group(1)}"
         metadata["title"] = header_match.group(2)
@@ -266,34 +377,80 @@ def populate_key_findings(findings_text: str) -> str:
     return result
 
 
-def update_task_in_file(tasks_file: Path, task_id: str, new_section: str) -> bool:
+def update_tasks_in_file(tasks_file: Path, updates: List[Tuple[str, str]]) -> Dict[str, bool]:
     """
-    Replace task section in tasks.md with updated version
+    Replace many task sections in tasks.md in one transaction
+
+    Uses the section offset index to splice only the changed byte ranges, then
+    commits with a single atomic temp-file-plus-rename write. A sync touching
+    50 tasks costs one read and one write.
 
     Args:
         tasks_file: Path to .agent/tasks.md
-        task_id: Task ID to update
-        new_section: New task section content
+        updates: (task_id, new_section) pairs; a later pair for the same ID wins
 
     Returns:
-        True if update successful, False otherwise
+        Dict mapping each task ID to True if its section was replaced, False if not found
     """
+    replacements = dict(updates)
+    results = dict.fromkeys(replacements, False)
+
     if not tasks_file.exists():
-        return False
+        return results
+
+    data = tasks_file.read_bytes()
+    index = load_section_index(tasks_file, data)
+
+    # Index may predate a same-size/same-mtime rewrite: verify spans against the bytes we hold
+    for task_id in replacements:
+        span = index.get(task_id)
+        header = SECTION_HEADER_PATTERN.match(data, span[0]) if span else None
+        if span and (header is None or header.group(1).decode("utf-8", "replace") != task_id):
+            index = build_section_index(data)
+            break
+
+    spans = sorted((index[task_id], task_id) for task_id in replacements if task_id in index)
+    if not spans:
+        return results
+
+    if any(spans[i][0][0] < spans[i - 1][0][1] for i in range(1, len(spans))):
+        # Sections missing their --- separator overlap: apply in order, re-indexing in memory
+        updated = data
+        for task_id, new_section in replacements.items():
+            span = build_section_index(updated).get(task_id)
+            if span:
+                updated = updated[: span[0]] + new_section.encode("utf-8") + updated[span[1] :]
+                results[task_id] = True
+    else:
+        pieces = []
+        position = 0
+        for (start, end), task_id in spans:
+            pieces.append(data[position:start])
+            pieces.append(replacements[task_id].encode("utf-8"))
+            position = end
+            results[task_id] = True
+        pieces.append(data[position:])
+        updated = b"".join(pieces)
 
-    content = tasks_file.read_text()
+    atomic_write_bytes(tasks_file, updated, mode=tasks_file.stat().st_mode)
+    save_section_index(tasks_file, build_section_index(updated))
 
-    # Pattern: ## [TASK-XXX] ... to next ---
-    pattern = rf"^##\s+\[{re.escape(task_id)}\]\s+.+?(?=^---\s*$)"
+    return results
 
-    if re.search(pattern, content, re.MULTILINE | re.DOTALL):
-        # Replace task section
-        updated = re.sub(pattern, new_section, content, count=1, flags=re.MULTILINE | re.DOTALL)
 
-        tasks_file.write_text(updated)
-        return True
+def update_task_in_file(tasks_file: Path, task_id: str, new_section: str) -> bool:
+    """
+    Replace task section in tasks.md with updated version
 
-    return False
+    Args:
+        tasks_file: Path to .agent/tasks.md
+        task_id: Task ID to update
+        new_section: New task section content
+
+    Returns:
+        True if update successful, False otherwise
+    """
+    return update_tasks_in_file(tasks_file, [(task_id, new_section)])[task_id]
 
 
 def generate_main_thread_log(
@@ -412,14 +569,28 @@ if __name__ == "__main__":
     command = sys.argv[1]
 
     if command == "extract":
-        # Extract task section from tasks.md
+        # Extract task section(s) from tasks.md
         # Usage: task_schema_manager.py extract <tasks_file_path> <task_id>
+        #        task_schema_manager.py extract <tasks_file_path> --many TASK-001,TASK-002,...
         if len(sys.argv) < 4:
-            print(json.dumps({"error": "extract requires <tasks_file_path> and <task_id>"}))
+            print(json.dumps({"error": "extract requires <tasks_file_path> and <task_id> (or --many <ids>)"}))
             sys.exit(1)
 
         tasks_file_path = sys.argv[2].replace("~", str(Path.home()))
         tasks_file = Path(tasks_file_path)
+
+        if sys.argv[3] == "--many":
+            if len(sys.argv) < 5:
+                print(json.dumps({"error": "extract --many requires a comma-separated list of task IDs"}))
+                sys.exit(1)
+
+            task_ids = [t.strip() for t in sys.argv[4].split(",") if t.strip()]
+            sections = extract_task_sections(tasks_file, task_ids)
+            missing = [task_id for task_id, section in sections.items() if section is None]
+            found = {task_id: section for task_id, section in sections.items() if section is not None}
+            print(json.dumps({"sections": found, "missing": missing}, indent=2))
+            sys.exit(0 if not missing else 1)
+
         task_id = sys.argv[3]
 
         section = extract_task_section(tasks_file, task_id)
@@ -525,6 +696,27 @@ if __name__ == "__main__":
         print(json.dumps({"success": success}))
         sys.exit(0 if success else 1)
 
+    elif command == "update_tasks_in_file":
+        # Update many task sections in one atomic write
+        # Usage: task_schema_manager.py update_tasks_in_file <tasks_file_path>  (JSON {task_id: new_section} on stdin)
+        if len(sys.argv) < 3:
+            print(json.dumps({"error": "update_tasks_in_file requires <tasks_file_path> and JSON updates on stdin"}))
+            sys.exit(1)
+
+        tasks_file_path = sys.argv[2].replace("~", str(Path.home()))
+        tasks_file = Path(tasks_file_path)
+
+        try:
+            updates = json.loads(sys.stdin.read())
+        except json.JSONDecodeError as e:
+            print(json.dumps({"error": f"Invalid JSON updates: {e}"}), file=sys.stderr)
+            sys.exit(1)
+
+        results = update_tasks_in_file(tasks_file, list(updates.items()))
+        missing = [task_id for task_id, updated in results.items() if not updated]
+        print(json.dumps({"success": not missing, "updated": [t for t in results if results[t]], "missing": missing}))
+        sys.exit(0 if not missing else 1)
+
     elif command == "extract_findings_from_agents":
         # Extract findings from all agent context files
         # Usage: task_schema_manager.py extract_findings_from_agents <context_dir> [agent1,agent2,...]
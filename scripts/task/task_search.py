@@ -5,14 +5,50 @@ Provides testable task search functionality with relevance ranking.
 Used by /task:execute, /task:search, and other task management commands.
 """
 
+import base64
+import hashlib
+import heapq
 import json
 from pathlib import Path
-import re
 import sys
-from typing import Dict, List, Tuple
-
-
-def load_tasks(tasks_file: Path) -> List[Dict]:
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from config import TaskSearchConfig
+from markdown_parser import Task, iter_tasks
+from task_cache import get_cache_path, get_cached_result, load_cached_tasks, put_cached_result
+from task_index import (
+    BITMAP_FIELDS,
+    BM25_INDEX_PREFIX,
+    INDEX_LOADERS,
+    INDEX_PREFIX,
+    TRIGRAM_INDEX_PREFIX,
+    VECTOR_INDEX_PREFIX,
+    allowed_edits,
+    bm25_scores,
+    complete_prefix,
+    filter_positions,
+    find_candidates,
+    fuzzy_term_matches,
+    load_completion_index,
+    load_search_index,
+    load_trigram_index,
+    normalize_value,
+    priority_boost,
+    tokenize_terms,
+)
+from task_sources import load_federated_index, source_kind
+from task_vectors import top_positions, use_vectors
+
+
+RANK_MODES = ("relevance", "bm25")
+PAGE_CACHE_PREFIX = "pages"
+DEFAULT_PAGE_SIZE = 26  # One A-Z screen
+
+# Highest score score_task can produce: title phrase + description phrase + priority boost
+MAX_RELEVANCE_SCORE = 100 + 20 + 5
+
+
+def load_tasks(tasks_file: Path) -> List[Task]:
     """
     Load tasks from markdown file.
 
@@ -20,7 +56,7 @@ def load_tasks(tasks_file: Path) -> List[Dict]:
         tasks_file: Path to tasks.md file
 
     Returns:
-        List of task dictionaries with id, title, status, priority, category, description
+        List of Task records with id, title, status, priority, category, epic, depends_on, description
 
     Raises:
         FileNotFoundError: If tasks file doesn't exist
@@ -29,46 +65,66 @@ def load_tasks(tasks_file: Path) -> List[Dict]:
     if not tasks_file.exists():
         raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
 
-    content = tasks_file.read_text()
+    tasks = load_cached_tasks(tasks_file)
 
-    if not content.strip():
+    if not tasks and is_blank_file(tasks_file):
         raise ValueError("Tasks file is empty")
 
-    tasks = []
-    # Parse markdown format: ## [TASK-XXX] Title
-    pattern = r"^##\s+\[TASK-(\d{3})\]\s+(.+?)$"
+    return tasks
 
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        task_id = f"TASK-{match.group(1)}"
-        title = match.group(2).strip()
 
-        # Extract task block until next task or end of file
-        start_pos = match.end()
-        next_match = re.search(pattern, content[start_pos:])
-        end_pos = start_pos + next_match.start() if next_match else len(content)
-        task_block = content[start_pos:end_pos]
+def is_blank_file(path: Path, chunk_size: int = 1 << 16) -> bool:
+    """Check whether a file holds only whitespace, reading no further than its first non-blank chunk."""
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            if chunk.strip():
+                return False
+    return True
 
-        # Parse fields
-        status_match = re.search(r"\*\*Status\*\*:\s*(\w+)", task_block)
-        priority_match = re.search(r"\*\*Priority\*\*:\s*(\w+)", task_block)
-        category_match = re.search(r"\*\*Category\*\*:\s*(\w+)", task_block)
-        desc_match = re.search(r"\*\*Description\*\*:\s*(.+?)(?=\n\n|\*\*|---)", task_block, re.DOTALL)
 
-        tasks.append(
-            {
-                "id": task_id,
-                "title": title,
-                "status": status_match.group(1) if status_match else "unknown",
-                "priority": priority_match.group(1) if priority_match else "medium",
-                "category": category_match.group(1) if category_match else "unknown",
-                "description": desc_match.group(1).strip() if desc_match else "",
-            }
-        )
+def score_task(task: Dict, query_lower: str, query_words: List[str]) -> int:
+    """
+    Score a single task against a query (see rank_by_relevance for the algorithm).
 
-    return tasks
+    Args:
+        task: Task record
+        query_lower: Lowercased query string
+        query_words: Lowercased query words
+
+    Returns:
+        Relevance score (0 = not relevant)
+    """
+    score = 0
 
+    # Title scoring (primary)
+    title_lower = task["title"].lower()
 
-def rank_by_relevance(tasks: List[Dict], query: str) -> List[Tuple[Dict, int]]:
+    # Exact phrase match
+    if query_lower in title_lower:
+        score += 100
+    else:
+        # Word-based matching
+        matching_words = sum(1 for word in query_words if word in title_lower)
+        total_words = len(query_words)
+
+        if matching_words == total_words:
+            score += 80
+        elif matching_words > total_words * 0.5:
+            score += 60
+        elif matching_words > 0:
+            score += 40
+
+    # Description scoring (secondary)
+    desc_lower = task["description"].lower()
+    if query_lower in desc_lower:
+        score += 20
+    elif any(word in desc_lower for word in query_words):
+        score += 10
+
+    return score + priority_boost(task)
+
+
+def rank_by_relevance(tasks: Iterable[Dict], query: str) -> List[Tuple[Dict, int]]:
     """
     Rank tasks by relevance to search query.
 
@@ -81,7 +137,7 @@ def rank_by_relevance(tasks: List[Dict], query: str) -> List[Tuple[Dict, int]]:
     - Priority boost: high/critical +5, medium +2
 
     Args:
-        tasks: List of task dictionaries
+        tasks: Task records (any iterable, e.g. a streaming iter_tasks generator)
         query: Search query string
 
     Returns:
@@ -93,38 +149,7 @@ def rank_by_relevance(tasks: List[Dict], query: str) -> List[Tuple[Dict, int]]:
     results = []
 
     for task in tasks:
-        score = 0
-
-        # Title scoring (primary)
-        title_lower = task["title"].lower()
-
-        # Exact phrase match
-        if query_lower in title_lower:
-            score += 100
-        else:
-            # Word-based matching
-            matching_words = sum(1 for word in query_words if word in title_lower)
-            total_words = len(query_words)
-
-            if matching_words == total_words:
-                score += 80
-            elif matching_words > total_words * 0.5:
-                score += 60
-            elif matching_words > 0:
-                score += 40
-
-        # Description scoring (secondary)
-        desc_lower = task["description"].lower()
-        if query_lower in desc_lower:
-            score += 20
-        elif any(word in desc_lower for word in query_words):
-            score += 10
-
-        # Priority boost
-        if task["priority"].lower() in ["critical", "high"]:
-            score += 5
-        elif task["priority"].lower() == "medium":
-            score += 2
+        score = score_task(task, query_lower, query_words)
 
         # Only include if some relevance found
         if score > 0:
@@ -135,8 +160,409 @@ def rank_by_relevance(tasks: List[Dict], query: str) -> List[Tuple[Dict, int]]:
     return results
 
 
+def top_k_by_relevance(tasks: Iterable[Dict], query: str, limit: int) -> List[Tuple[Dict, int]]:
+    """
+    Return the best `limit` results of rank_by_relevance without collecting all scores.
+
+    Keeps a min-heap of at most `limit` entries keyed by (score, -arrival) so ties
+    resolve in input order exactly as the stable sort does. Once the heap is full of
+    MAX_RELEVANCE_SCORE hits no later task can displace them, so the input is not
+    consumed any further.
+
+    Args:
+        tasks: Task records (any iterable, e.g. a streaming iter_tasks generator)
+        query: Search query string
+        limit: Number of results to keep (must be > 0)
+
+    Returns:
+        List of (task, score) tuples sorted by score descending
+    """
+    query_lower = query.lower()
+    query_words = query_lower.split()
+    heap: List[Tuple[int, int, Dict]] = []
+
+    for arrival, task in enumerate(tasks):
+        score = score_task(task, query_lower, query_words)
+        if score <= 0:
+            continue
+
+        entry = (score, -arrival, task)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        elif heap[0][0] >= MAX_RELEVANCE_SCORE:
+            break
+
+    return [(task, score) for score, _, task in sorted(heap, reverse=True)]
+
+
+def rank_with_index(
+    tasks: List[Task],
+    index: Dict,
+    query: str,
+    include_completed: bool = True,
+    limit: int = 0,
+    allowed: Optional[Set[int]] = None,
+) -> List[Tuple[Dict, int]]:
+    """
+    Rank tasks like rank_by_relevance, scoring only tasks the inverted index selects.
+
+    Any title or description match scores at least 10, so tasks without a match
+    (which only carry the +5/+2 priority boost) always rank below every candidate
+    and are appended in file order. The result is identical to rank_by_relevance.
+
+    Args:
+        tasks: Tasks in file order (as indexed)
+        index: Index dict from task_index.load_search_index
+        query: Search query string
+        include_completed: Include completed tasks in results
+        limit: Maximum results to return (0 = unlimited)
+        allowed: Task positions passing attribute filters (None = all); other
+            rows are never scored or visited
+
+    Returns:
+        List of (task, score) tuples sorted by score descending
+    """
+    query_lower = query.lower()
+    query_words = query_lower.split()
+    rows = range(len(tasks)) if allowed is None else sorted(allowed)
+
+    if not query_words:
+        # Blank query matches every title as a phrase; nothing to narrow down
+        tasks = [tasks[position] for position in rows]
+        if not include_completed:
+            tasks = [t for t in tasks if t["status"] != "completed"]
+        results = rank_by_relevance(tasks, query)
+        return results[:limit] if limit > 0 else results
+
+    candidates = find_candidates(index, query_words)
+    if allowed is not None:
+        candidates &= allowed
+
+    results = []
+    for position in sorted(candidates):
+        task = tasks[position]
+        if include_completed or task["status"] != "completed":
+            results.append((task, score_task(task, query_lower, query_words)))
+
+    results.sort(key=lambda x: x[1], reverse=True)
+
+    for boost in (5, 2):
+        if limit > 0 and len(results) >= limit:
+            break
+        results.extend(
+            (tasks[position], boost)
+            for position in rows
+            if position not in candidates
+            and (include_completed or tasks[position]["status"] != "completed")
+            and priority_boost(tasks[position]) == boost
+        )
+
+    return results[:limit] if limit > 0 else results
+
+
+def rank_vectorized(
+    tasks: List[Task],
+    vectors: Dict,
+    query: str,
+    include_completed: bool = True,
+    limit: int = 0,
+    allowed: Optional[Set[int]] = None,
+) -> List[Tuple[Dict, int]]:
+    """
+    Rank tasks like rank_by_relevance, scoring every task at once with NumPy.
+
+    Word hits per task come from the title/description incidence matrices (one
+    row mask per distinct query word); task text is only read for the phrase
+    check on rows where every word already matched. The result is identical to
+    rank_by_relevance. Requires NumPy (see task_vectors.use_vectors).
+
+    Args:
+        tasks: Tasks in file order (as indexed)
+        vectors: Index dict from task_index.load_vector_index
+        query: Search query string (at least one word)
+        include_completed: Include completed tasks in results
+        limit: Maximum results to return (0 = unlimited)
+        allowed: Task positions passing attribute filters (None = all)
+
+    Returns:
+        List of (task, score) tuples sorted by score descending
+    """
+    import numpy as np
+
+    query_lower = query.lower()
+    query_words = query_lower.split()
+    total_words = len(query_words)
+
+    title_hits = {word: vectors["title"].rows_containing(word) for word in set(query_words)}
+    description_hits = {word: vectors["description"].rows_containing(word) for word in set(query_words)}
+
+    # Repeated query words count once per occurrence, as in score_task
+    matching_words = sum(title_hits[word].astype(np.intc) for word in query_words)
+    all_in_title = matching_words == total_words
+    all_in_description = np.logical_and.reduce(list(description_hits.values()))
+    any_in_description = np.logical_or.reduce(list(description_hits.values()))
+
+    if query_words == [query_lower]:
+        # A single word without surrounding whitespace is its own phrase
+        title_phrase, description_phrase = all_in_title, all_in_description
+    else:
+        title_phrase = np.zeros(len(tasks), dtype=bool)
+        for position in np.flatnonzero(all_in_title):
+            title_phrase[position] = query_lower in tasks[position]["title"].lower()
+        description_phrase = np.zeros(len(tasks), dtype=bool)
+        for position in np.flatnonzero(all_in_description):
+            description_phrase[position] = query_lower in tasks[position]["description"].lower()
+
+    scores = np.select(
+        [title_phrase, all_in_title, matching_words > total_words * 0.5, matching_words > 0], [100, 80, 60, 40], 0
+    )
+    scores += np.where(description_phrase, 20, np.where(any_in_description, 10, 0))
+    scores += vectors["boost"]
+
+    eligible = scores > 0
+    if not include_completed:
+        eligible &= ~vectors["completed"]
+    if allowed is not None:
+        in_filter = np.zeros(len(tasks), dtype=bool)
+        in_filter[np.fromiter(allowed, dtype=np.intp, count=len(allowed))] = True
+        eligible &= in_filter
+
+    ranked = top_positions(scores, np.flatnonzero(eligible), limit)
+    return [(tasks[position], score) for position, score in zip(ranked.tolist(), scores[ranked].tolist())]
+
+
+def rank_bm25(
+    tasks: List[Task],
+    index: Dict,
+    query: str,
+    include_completed: bool = True,
+    limit: int = 0,
+    allowed: Optional[Set[int]] = None,
+) -> List[Tuple[Dict, float]]:
+    """
+    Rank tasks by BM25 over separately weighted title and description fields.
+
+    Only tasks matching at least one query term are returned. The priority boost
+    (high/critical +5, medium +2) is added to each BM25 score.
+
+    Args:
+        tasks: Tasks in file order (as indexed)
+        index: Index dict from task_index.load_bm25_index
+        query: Search query string
+        include_completed: Include completed tasks in results
+        limit: Maximum results to return (0 = unlimited)
+        allowed: Task positions passing attribute filters (None = all)
+
+    Returns:
+        List of (task, score) tuples sorted by score descending (ties in file order)
+    """
+    results = []
+    for position, score in sorted(bm25_scores(index, query).items()):
+        if allowed is not None and position not in allowed:
+            continue
+        task = tasks[position]
+        if include_completed or task["status"] != "completed":
+            results.append((task, score + priority_boost(task)))
+
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:limit] if limit > 0 else results
+
+
+def rank_fuzzy(
+    tasks: List[Task],
+    index: Dict,
+    query: str,
+    include_completed: bool = True,
+    limit: int = 0,
+    allowed: Optional[Set[int]] = None,
+) -> List[Tuple[Dict, int]]:
+    """
+    Rank tasks by typo-tolerant title matching.
+
+    Each query word is matched against title terms within its edit budget (see
+    task_index.fuzzy_term_matches); a term at distance d counts 1 - d / (budget + 1).
+    A task scores 100 * (sum of its best per-word matches) / (number of query words),
+    plus the priority boost.
+
+    Args:
+        tasks: Tasks in file order (as indexed)
+        index: Index dict from task_index.load_trigram_index
+        query: Search query string
+        include_completed: Include completed tasks in results
+        limit: Maximum results to return (0 = unlimited)
+        allowed: Task positions passing attribute filters (None = all)
+
+    Returns:
+        List of (task, score) tuples sorted by score descending (ties in file order)
+    """
+    query_words = tokenize_terms(query)
+    best: Dict[int, List[float]] = {}
+
+    for word_index, word in enumerate(query_words):
+        budget = allowed_edits(word)
+        for token_id, distance in fuzzy_term_matches(index, word).items():
+            similarity = 1 - distance / (budget + 1)
+            for position in index["postings"][token_id]:
+                if allowed is not None and position not in allowed:
+                    continue
+                row = best.get(position)
+                if row is None:
+                    row = best[position] = [0.0] * len(query_words)
+                if similarity > row[word_index]:
+                    row[word_index] = similarity
+
+    results = []
+    for position in sorted(best):
+        task = tasks[position]
+        if include_completed or task["status"] != "completed":
+            score = round(100 * sum(best[position]) / len(query_words)) + priority_boost(task)
+            results.append((task, score))
+
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:limit] if limit > 0 else results
+
+
+def check_search_options(stream: bool, rank: str, fuzzy: bool) -> None:
+    """
+    Validate a combination of search options.
+
+    Raises:
+        ValueError: If rank is unknown or the options cannot be combined
+    """
+    if rank not in RANK_MODES:
+        raise ValueError(f"Unknown rank mode: {rank} (expected one of {', '.join(RANK_MODES)})")
+
+    if stream and rank == "bm25":
+        raise ValueError("BM25 ranking needs index statistics and cannot be combined with stream")
+
+    if fuzzy and (stream or rank != "relevance"):
+        raise ValueError("Fuzzy search uses the trigram index and cannot be combined with stream or bm25")
+
+
+def normalize_filters(filters: Optional[Dict]) -> Dict[str, List[str]]:
+    """
+    Normalize attribute filters to field → list of values.
+
+    Accepts comma-separated strings or lists per field (e.g., {"status": "pending,blocked"}).
+    Fields without values are dropped.
+
+    Raises:
+        ValueError: If filters is not a mapping
+    """
+    if filters is not None and not isinstance(filters, dict):
+        raise ValueError("filters must be an object mapping field to values")
+
+    normalized = {}
+    for field, values in (filters or {}).items():
+        if isinstance(values, str):
+            values = values.split(",")
+        values = [value.strip() for value in values if value and value.strip()]
+        if values:
+            normalized[field] = values
+    return normalized
+
+
+def matches_filters(task: Dict, filters: Dict[str, List[str]]) -> bool:
+    """Check a single task against attribute filters (used where no bitmap index exists, e.g. streaming)."""
+    return all(
+        normalize_value(task[field]) in {normalize_value(value) for value in values}
+        for field, values in filters.items()
+    )
+
+
+def rank_loaded_tasks(
+    tasks: List[Task],
+    load_index: Callable[[str], Dict],
+    query: str,
+    limit: int = 5,
+    include_completed: bool = False,
+    rank: str = "relevance",
+    fuzzy: bool = False,
+    filters: Optional[Dict] = None,
+) -> List[Tuple[Dict, int]]:
+    """
+    Rank tasks that are already in memory using the index the options call for.
+
+    Attribute filters are resolved to a set of rows through the bitmap index
+    before any text scoring.
+
+    Args:
+        tasks: Tasks in file order
+        load_index: Returns the index of a given kind (task_index.INDEX_LOADERS key) for tasks
+        query: Search query
+        limit: Maximum results to return (0 = unlimited)
+        include_completed: Include completed tasks in results
+        rank: "relevance" or "bm25"
+        fuzzy: Typo-tolerant title matching
+        filters: Field → accepted values for status, priority, category, epic
+
+    Returns:
+        List of (task, score) tuples, ranked by relevance
+    """
+    filters = normalize_filters(filters)
+    allowed = None
+
+    if filters:
+        # An explicit status filter decides on completed tasks by itself
+        include_completed = include_completed or "status" in filters
+        allowed = set(filter_positions(load_index(INDEX_PREFIX), filters))
+
+    if fuzzy:
+        return rank_fuzzy(tasks, load_index(TRIGRAM_INDEX_PREFIX), query, include_completed, limit, allowed)
+
+    if rank == "bm25":
+        return rank_bm25(tasks, load_index(BM25_INDEX_PREFIX), query, include_completed, limit, allowed)
+
+    if query.split() and use_vectors(len(tasks)):
+        return rank_vectorized(tasks, load_index(VECTOR_INDEX_PREFIX), query, include_completed, limit, allowed)
+
+    return rank_with_index(tasks, load_index(INDEX_PREFIX), query, include_completed, limit, allowed)
+
+
+def list_tasks(
+    tasks_file: Path, filters: Optional[Dict] = None, include_completed: bool = False, limit: int = 0
+) -> List[Task]:
+    """
+    List tasks matching attribute filters in file order, without a text query.
+
+    Args:
+        tasks_file: Path to tasks.md file
+        filters: Field → accepted values for status, priority, category, epic
+        include_completed: Include completed tasks (implied by an explicit status filter)
+        limit: Maximum tasks to return (0 = unlimited)
+
+    Returns:
+        Matching tasks in file order
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+        ValueError: If tasks file is empty or a filter field is unknown
+    """
+    stat = tasks_file.stat() if tasks_file.exists() else None
+    tasks = load_tasks(tasks_file)
+    positions = filter_positions(
+        load_search_index(tasks_file, tasks, stat), normalize_filters(filters), include_completed
+    )
+
+    if positions is None:
+        positions = range(len(tasks))
+    if limit > 0:
+        positions = positions[:limit]
+
+    return [tasks[position] for position in positions]
+
+
 def search_tasks(
-    query: str, tasks_file: Path, limit: int = 5, include_completed: bool = False
+    query: str,
+    tasks_file: Path,
+    limit: int = 5,
+    include_completed: bool = False,
+    stream: bool = False,
+    rank: str = "relevance",
+    fuzzy: bool = False,
+    filters: Optional[Dict] = None,
 ) -> List[Tuple[Dict, int]]:
     """
     Search tasks by query string with optional filtering.
@@ -146,28 +572,515 @@ def search_tasks(
         tasks_file: Path to tasks.md file
         limit: Maximum results to return (0 = unlimited)
         include_completed: Include completed tasks in results
+        stream: Filter and score tasks as they are parsed off the file instead of
+            loading the full task list (constant memory for large archives).
+            Otherwise only tasks selected by the persistent inverted index are scored.
+        rank: "relevance" (bucketed title/description scorer) or "bm25"
+            (term-weighted ranking; not available with stream)
+        fuzzy: Match title words within a small edit distance via the trigram
+            index (typo-tolerant; not available with stream or bm25)
+        filters: Field → accepted values for status, priority, category, epic
+            (e.g., {"priority": ["high"], "status": ["in-progress"]}); values for one
+            field are OR'ed, fields are AND'ed, and an explicit status filter
+            overrides include_completed
 
     Returns:
         List of (task, score) tuples, ranked by relevance
 
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+        ValueError: If tasks file is empty or malformed, or the options are unsupported
+    """
+    check_search_options(stream, rank, fuzzy)
+
+    if not stream:
+        stat = tasks_file.stat() if tasks_file.exists() else None
+        tasks = load_tasks(tasks_file)
+
+        def load_index(kind: str) -> Dict:
+            return INDEX_LOADERS[kind](tasks_file, tasks, stat)
+
+        return rank_loaded_tasks(tasks, load_index, query, limit, include_completed, rank, fuzzy, filters)
+
+    if not tasks_file.exists():
+        raise FileNotFoundError(f"Tasks file not found: {tasks_file}")
+    if is_blank_file(tasks_file):
+        # Same check and error as load_tasks (a blank file never has tasks)
+        raise ValueError("Tasks file is empty")
+    tasks = iter_tasks(tasks_file)
+    filters = normalize_filters(filters)
+    unknown = set(filters) - set(BITMAP_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown filter field(s): {', '.join(sorted(unknown))}")
+
+    # Filter by attributes and status (before any scoring)
+    if filters:
+        tasks = (t for t in tasks if matches_filters(t, filters))
+    if not include_completed and "status" not in filters:
+        tasks = (t for t in tasks if t["status"] != "completed")
+
+    # Bounded top-k: memory stays proportional to limit
+    if limit > 0:
+        return top_k_by_relevance(tasks, query, limit)
+
+    return rank_by_relevance(tasks, query)
+
+
+def search_federated(
+    query: str, agent_dir: Path, limit: int = 5, include_completed: bool = False
+) -> Tuple[List[Tuple[Dict, int, str]], Dict]:
+    """
+    Search every task file under an .agent directory with one relevance ranking.
+
+    Covers tasks.md, tasks-archive.md and Session-*/TASK-*/task.md through the
+    combined federated index. Scores are the rank_by_relevance scores; ties keep
+    source discovery order, then file order. A task copied into several files
+    appears once per file.
+
+    Args:
+        query: Search query
+        agent_dir: Path to .agent directory
+        limit: Maximum results to return (0 = unlimited)
+        include_completed: Include completed tasks in results
+
+    Returns:
+        Tuple of (results, federated index) where results are (task, score, source)
+        tuples and source is the file path relative to agent_dir
+    """
+    federated = load_federated_index(agent_dir)
+    query_lower = query.lower()
+    query_words = query_lower.split()
+
+    scored = []
+    boost_only: Dict[int, List[Tuple[Dict, int, str]]] = {5: [], 2: []}
+
+    for source, segment in federated["sources"].items():
+        tasks = [Task.from_record(record) for record in segment["records"]]
+        candidates = find_candidates(segment, query_words) if query_words else set(range(len(tasks)))
+
+        for position, task in enumerate(tasks):
+            if not include_completed and task["status"] == "completed":
+                continue
+
+            if position in candidates:
+                scored.append((task, score_task(task, query_lower, query_words), source))
+            else:
+                # No text match: only the priority boost (below any match score) applies
+                boost = priority_boost(task)
+                if boost:
+                    boost_only[boost].append((task, boost, source))
+
+    scored.sort(key=lambda x: x[1], reverse=True)
+    results = scored + boost_only[5] + boost_only[2]
+
+    return (results[:limit] if limit > 0 else results), federated
+
+
+def parse_search_options(args: List[str]) -> Dict:
+    """
+    Parse search CLI flags into search_tasks keyword arguments.
+
+    Args:
+        args: Flags following the query and tasks file (e.g., ["--limit=10", "--priority=high,critical"])
+
+    Returns:
+        Dict with limit, include_completed, stream, rank, fuzzy and filters
+    """
+    options = {
+        "limit": 5,
+        "include_completed": False,
+        "stream": False,
+        "rank": "relevance",
+        "fuzzy": False,
+        "filters": {},
+    }
+
+    for arg in args:
+        if arg.startswith("--limit="):
+            options["limit"] = int(arg.split("=")[1])
+        elif arg == "--completed":
+            options["include_completed"] = True
+        elif arg == "--stream":
+            options["stream"] = True
+        elif arg.startswith("--rank="):
+            options["rank"] = arg.split("=", 1)[1]
+        elif arg == "--fuzzy":
+            options["fuzzy"] = True
+        elif arg.startswith("--") and "=" in arg and arg[2:].split("=", 1)[0] in BITMAP_FIELDS:
+            field, values = arg[2:].split("=", 1)
+            options["filters"][field] = values.split(",")
+
+    return options
+
+
+def iter_result_records(results: List[Tuple[Dict, int]], rank: str = "relevance", start: int = 0) -> Iterator[Dict]:
+    """
+    Yield the JSON record for each search result.
+
+    Args:
+        results: List of (task, score) tuples from search_tasks()
+        rank: Rank mode used (relevance scores are ints, BM25 scores are rounded)
+        start: Overall rank of the first result (labels continue across pages)
+
+    Yields:
+        Dict with option, task_id, title, status, priority and score
+    """
+    for i, (task, score) in enumerate(results, start):
+        yield {
+            "option": option_label(i),
+            "task_id": task["id"],
+            "title": task["title"],
+            "status": task["status"],
+            "priority": task["priority"],
+            "score": int(score) if rank == "relevance" else round(score, 3),
+        }
+
+
+def format_search_output(
+    query: str, results: List[Tuple[Dict, int]], rank: str = "relevance", fuzzy: bool = False, start: int = 0
+) -> Dict:
+    """
+    Build the JSON-serializable search response printed by the CLI.
+
+    Args:
+        query: Search query
+        results: List of (task, score) tuples from search_tasks()
+        rank: Rank mode used
+        fuzzy: Whether fuzzy matching was used
+        start: Overall rank of the first result (for pages after the first)
+
+    Returns:
+        Dict with query, rank, fuzzy, total_results, results and table
+    """
+    return {
+        "query": query,
+        "rank": rank,
+        "fuzzy": fuzzy,
+        "total_results": len(results),
+        "results": list(iter_result_records(results, rank, start)),
+        "table": format_task_table(results, start=start),
+    }
+
+
+def write_ndjson(output: Dict, stream=None) -> None:
+    """
+    Print a response as NDJSON: one line per result, then one summary line.
+
+    The summary carries every response field except results and table, so large
+    pages are emitted incrementally instead of as one JSON document.
+
+    Args:
+        output: Response dict with a "results" list (e.g., from format_search_output)
+        stream: File to write to (defaults to sys.stdout)
+    """
+    stream = stream or sys.stdout
+    for record in output["results"]:
+        stream.write(json.dumps(record) + "\n")
+    summary = {key: value for key, value in output.items() if key not in ("results", "table")}
+    stream.write(json.dumps(summary) + "\n")
+    stream.flush()
+
+
+def complete_tasks(
+    text: str, tasks_file: Path, limit: int = 5, include_completed: bool = False, index: Optional[Dict] = None
+) -> Tuple[List[Tuple[Dict, str]], bool]:
+    """
+    Complete typed text against task titles and IDs, highest priority first.
+
+    Answered from the persisted completion index: tasks.md is only parsed when
+    the index is stale. At most TaskSearchConfig.COMPLETE_SCAN_LIMIT index
+    entries are examined per call.
+
+    Args:
+        text: Typed text (e.g., "cach", "TASK-04", "fix sess")
+        tasks_file: Path to tasks.md file
+        limit: Maximum completions (0 = until the scan budget runs out)
+        include_completed: Also complete completed tasks (after every active one)
+        index: Already loaded completion index (e.g., kept warm by the daemon)
+
+    Returns:
+        Tuple of ([(task, completed term)] best first, whether the scan budget cut the search short);
+        tasks carry id, title, status and priority
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+    """
+    if index is None:
+        index = load_completion_index(tasks_file)
+
+    completions, truncated = complete_prefix(
+        index, text, limit, include_completed, TaskSearchConfig.COMPLETE_SCAN_LIMIT
+    )
+
+    results = []
+    for position, term in completions:
+        task_id, title, status, priority = index["tasks"][position]
+        results.append(({"id": task_id, "title": title, "status": status, "priority": priority}, term))
+
+    return results, truncated
+
+
+def format_completion_output(text: str, completions: List[Tuple[Dict, str]], truncated: bool) -> Dict:
+    """Build the JSON-serializable completion response (same shape as search results plus the completed term)."""
+    return {
+        "prefix": text,
+        "total_results": len(completions),
+        "truncated": truncated,
+        "results": [
+            {
+                "option": option_label(i),
+                "task_id": task["id"],
+                "title": task["title"],
+                "status": task["status"],
+                "priority": task["priority"],
+                "completion": term,
+            }
+            for i, (task, term) in enumerate(completions)
+        ],
+        "table": format_task_table([(task, 0) for task, _ in completions]),
+    }
+
+
+def search_cache_key(query: str, options: Dict) -> str:
+    """
+    Build the result cache key for a search: normalized query plus every option that changes the results.
+
+    Ranking is case-insensitive, so the query is lowercased; stream only changes how tasks are read.
+    """
+    filters = {
+        field: sorted(normalize_value(value) for value in values)
+        for field, values in normalize_filters(options.get("filters")).items()
+    }
+    key = {name: value for name, value in options.items() if name not in ("stream", "filters")}
+    return json.dumps({"query": query.lower(), "filters": filters, **key}, sort_keys=True)
+
+
+def cached_search(query: str, tasks_file: Path, options: Dict) -> Dict:
+    """
+    Search via the persistent result cache (see TaskSearchConfig.RESULT_CACHE_*).
+
+    A hit is answered from .agent/.cache without parsing tasks.md; any change to
+    the file's content invalidates every cached result.
+
+    Args:
+        query: Search query
+        tasks_file: Path to tasks.md file
+        options: search_tasks keyword arguments (as from parse_search_options)
+
+    Returns:
+        Search response as produced by format_search_output
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+        ValueError: If tasks file is empty or malformed, or options are unsupported
+    """
+    # Validate before the lookup: stream is not part of the key, so a cached result must not mask invalid flags
+    check_search_options(options["stream"], options["rank"], options["fuzzy"])
+
+    key = search_cache_key(query, options)
+    ttl = TaskSearchConfig.RESULT_CACHE_TTL_SECONDS
+
+    if TaskSearchConfig.RESULT_CACHE_SIZE > 0:
+        output = get_cached_result(tasks_file, key, ttl)
+        if output is not None:
+            return {**output, "query": query}
+
+    results = search_tasks(query, tasks_file, **options)
+    output = format_search_output(query, results, options["rank"], options["fuzzy"])
+    put_cached_result(tasks_file, key, output, TaskSearchConfig.RESULT_CACHE_SIZE, ttl)
+    return output
+
+
+def encode_cursor(state: Dict) -> str:
+    """Encode pagination state as an opaque, URL-safe cursor string."""
+    data = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed (including a non-integer or
+            negative offset, or a page size that is not a positive integer)
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if (
+        not isinstance(state, dict)
+        or not {"key", "version", "offset", "size"} <= set(state)
+        or not all(isinstance(state[name], str) for name in ("key", "version"))
+        or not all(type(state[name]) is int for name in ("offset", "size"))
+        or state["offset"] < 0
+        or state["size"] <= 0
+    ):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return state
+
+
+def search_page(
+    query: str,
+    tasks_file: Path,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_completed: bool = False,
+    stream: bool = False,
+    rank: str = "relevance",
+    fuzzy: bool = False,
+    filters: Optional[Dict] = None,
+) -> Dict:
+    """
+    Return one page of a full ranking, with a cursor for the next page.
+
+    The first page ranks every match once and keeps (position, score) pairs in
+    .agent/.cache/pages.<fingerprint> (a small LRU, see TaskSearchConfig.PAGE_*);
+    following pages are sliced from it without re-scoring. Cursors are opaque and
+    tied to the search and to tasks.md's size and mtime, so a cursor from before
+    an edit is rejected rather than resuming a different ranking.
+
+    Args:
+        query: Search query
+        tasks_file: Path to tasks.md file
+        page_size: Results per page (default: the cursor's page size, else DEFAULT_PAGE_SIZE)
+        cursor: next_cursor from the previous page (None = first page)
+        include_completed, stream, rank, fuzzy, filters: As for search_tasks
+            (stream is not supported: pages need the full ranking)
+
+    Returns:
+        Dict with "results" ((task, score) tuples), "offset" (overall rank of the
+        first result), "total" (matches across all pages) and "next_cursor"
+        (None on the last page)
+
+    Raises:
+        FileNotFoundError: If tasks file doesn't exist
+        ValueError: If tasks file is empty or malformed, options are unsupported,
+            or the cursor is invalid, belongs to another search or has expired
+    """
+    if stream:
+        raise ValueError("Pagination keeps the full ranking and cannot be combined with stream")
+    check_search_options(stream, rank, fuzzy)
+
+    options = {"include_completed": include_completed, "rank": rank, "fuzzy": fuzzy, "filters": filters}
+    key = hashlib.sha1(search_cache_key(query, options).encode("utf-8")).hexdigest()[:16]
+    ttl = TaskSearchConfig.PAGE_CURSOR_TTL_SECONDS
+
+    stat = tasks_file.stat() if tasks_file.exists() else None
+    tasks = load_tasks(tasks_file)
+    version = f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    if cursor is None:
+        offset = 0
+
+        def load_index(kind: str) -> Dict:
+            return INDEX_LOADERS[kind](tasks_file, tasks, stat)
+
+        results = rank_loaded_tasks(tasks, load_index, query, 0, include_completed, rank, fuzzy, filters)
+        positions = {id(task): position for position, task in enumerate(tasks)}
+        ranking = ([positions[id(task)] for task, _ in results], [score for _, score in results])
+        put_cached_result(tasks_file, key, ranking, TaskSearchConfig.PAGE_CACHE_SIZE, ttl, PAGE_CACHE_PREFIX)
+    else:
+        state = decode_cursor(cursor)
+        if state["key"] != key:
+            raise ValueError("Cursor belongs to a different search (query or options changed)")
+
+        ranking = get_cached_result(tasks_file, key, ttl, PAGE_CACHE_PREFIX) if state["version"] == version else None
+        if ranking is None:
+            raise ValueError("Cursor expired (tasks.md changed or the ranking was evicted); search again")
+
+        offset = state["offset"]
+        if page_size is None:
+            page_size = state["size"]
+
+    if page_size is None:
+        page_size = DEFAULT_PAGE_SIZE
+    if page_size <= 0:
+        raise ValueError("Page size must be positive")
+
+    positions, scores = ranking
+    end = offset + page_size
+    next_cursor = None
+    if end < len(positions):
+        next_cursor = encode_cursor({"key": key, "version": version, "offset": end, "size": page_size})
+
+    return {
+        "results": [(tasks[position], score) for position, score in zip(positions[offset:end], scores[offset:end])],
+        "offset": offset,
+        "total": len(positions),
+        "next_cursor": next_cursor,
+    }
+
+
+def search_batch(tasks_file: Path, lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    Answer many JSONL queries against one load of the tasks and indexes.
+
+    Each line is a JSON object with "query" and optional per-query options
+    (limit, include_completed, rank, fuzzy, filters) plus an optional "id" that is echoed
+    back, or a bare JSON string used as the query. Blank lines are skipped.
+
+    Args:
+        tasks_file: Path to tasks.md file
+        lines: JSONL input lines (e.g., sys.stdin)
+
+    Yields:
+        One response per query: format_search_output fields (plus "id" if given),
+        or {"error": ..., "line": n} for a malformed or unsupported query
+
     Raises:
         FileNotFoundError: If tasks file doesn't exist
         ValueError: If tasks file is empty or malformed
     """
+    stat = tasks_file.stat() if tasks_file.exists() else None
     tasks = load_tasks(tasks_file)
+    indexes: Dict[str, Dict] = {}
 
-    # Filter by status if not including completed
-    if not include_completed:
-        tasks = [t for t in tasks if t["status"] != "completed"]
+    def load_index(kind: str) -> Dict:
+        if kind not in indexes:
+            indexes[kind] = INDEX_LOADERS[kind](tasks_file, tasks, stat)
+        return indexes[kind]
 
-    # Rank by relevance
-    results = rank_by_relevance(tasks, query)
+    defaults = parse_search_options([])
 
-    # Apply limit
-    if limit > 0:
-        results = results[:limit]
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
 
-    return results
+        request = None
+        try:
+            request = json.loads(line)
+            if isinstance(request, str):
+                request = {"query": request}
+            if not isinstance(request, dict) or not isinstance(request.get("query"), str):
+                raise ValueError('expected a JSON object with a string "query"')
+
+            options = {key: request.get(key, default) for key, default in defaults.items()}
+            if options["stream"]:
+                raise ValueError("stream is not supported in batch mode")
+            check_search_options(False, options["rank"], options["fuzzy"])
+
+            results = rank_loaded_tasks(
+                tasks,
+                load_index,
+                request["query"],
+                int(options["limit"]),
+                bool(options["include_completed"]),
+                options["rank"],
+                bool(options["fuzzy"]),
+                options["filters"],
+            )
+        except (TypeError, ValueError) as e:
+            response = {"error": str(e), "line": line_number}
+        else:
+            response = format_search_output(request["query"], results, options["rank"], bool(options["fuzzy"]))
+
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+
+        yield response
 
 
 def format_task_row(task: Dict, option: str) -> str:
@@ -176,7 +1089,7 @@ def format_task_row(task: Dict, option: str) -> str:
 
     Args:
         task: Task dictionary
-        option: Option letter (A-Z)
+        option: Option label (A-Z, then AA, AB, ...)
 
     Returns:
         Formatted table row
@@ -207,13 +1120,24 @@ def format_task_row(task: Dict, option: str) -> str:
     return f"| {option} | {status_str} | {priority_str} | {title} |"
 
 
-def format_task_table(results: List[Tuple[Dict, int]], show_scores: bool = False) -> str:
+def option_label(index: int) -> str:
+    """Return the option label for a 0-based result index: A-Z, then AA, AB, ... (like spreadsheet columns)."""
+    label = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+def format_task_table(results: List[Tuple[Dict, int]], show_scores: bool = False, start: int = 0) -> str:
     """
     Format search results as markdown table.
 
     Args:
         results: List of (task, score) tuples from search_tasks()
         show_scores: Include relevance scores in table
+        start: Overall rank of the first result (labels continue across pages)
 
     Returns:
         Formatted markdown table
@@ -226,15 +1150,14 @@ def format_task_table(results: List[Tuple[Dict, int]], show_scores: bool = False
     lines.append("| Option | Status | Priority | Task Description |")
     lines.append("|--------|--------|----------|------------------|")
 
-    for i, (task, _) in enumerate(results):
-        option = chr(65 + i)  # A, B, C, ...
-        lines.append(format_task_row(task, option))
+    for i, (task, _) in enumerate(results, start):
+        lines.append(format_task_row(task, option_label(i)))
 
     if show_scores:
         lines.append("")
         lines.append(
             "(Relevance scores: "
-            + ", ".join(f"{chr(65 + i)}={int(score)}" for i, (_, score) in enumerate(results))
+            + ", ".join(f"{option_label(i)}={int(score)}" for i, (_, score) in enumerate(results, start))
             + ")"
         )
 
@@ -272,8 +1195,17 @@ def validate_tasks_file(tasks_file: Path) -> Tuple[bool, str]:
 def main():
     """CLI interface for task search utility"""
     if len(sys.argv) < 3:
-        print("Usage: task_search.py search <query> <tasks-file> [--limit=5] [--completed]")
+        print(
+            "Usage: task_search.py search <query> <tasks-file> [--limit=5] [--completed] [--stream] "
+            "[--rank=relevance|bm25] [--fuzzy]"
+        )
+        print("       task_search.py search <query> <tasks-file> --page-size=N [--cursor=...] [--ndjson]")
         print("       task_search.py validate <tasks-file>")
+        print("       task_search.py index <tasks-file>")
+        print("       task_search.py search-batch <tasks-file> < queries.jsonl")
+        print("       task_search.py search-all <query> <agent-dir> [--limit=5] [--completed]")
+        print("       task_search.py complete <prefix> <tasks-file> [--limit=5] [--completed]")
+        print("       task_search.py list <tasks-file> [--status=..] [--priority=..] [--category=..] [--epic=..]")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -290,46 +1222,140 @@ def main():
             print(json.dumps({"valid": False, "error": error}))
         sys.exit(0 if is_valid else 1)
 
-    elif command == "search":
-        if len(sys.argv) < 4:
-            print("Usage: task_search.py search <query> <tasks-file> [--limit=5] [--completed]")
+    elif command == "index":
+        tasks_file = Path(sys.argv[2])
+        try:
+            stat = tasks_file.stat()
+            tasks = load_tasks(tasks_file)
+            index = load_search_index(tasks_file, tasks, stat)
+            trigram_index = load_trigram_index(tasks_file, tasks, stat)
+            output = {
+                "tasks": index["count"],
+                "tokens": len(index["postings"]),
+                "title_terms": len(trigram_index["tokens"]),
+                "index_file": str(get_cache_path(tasks_file, INDEX_PREFIX)),
+            }
+            print(json.dumps(output, indent=2))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
             sys.exit(1)
 
-        query = sys.argv[2]
-        tasks_file = Path(sys.argv[3])
-        limit = 5
-        include_completed = False
-
-        # Parse options (skip first 4 args: program, search, query, tasks_file)
-        for arg in sys.argv[4:]:
-            if arg.startswith("--limit="):
-                limit = int(arg.split("=")[1])
-            elif arg == "--completed":
-                include_completed = True
+    elif command == "list":
+        tasks_file = Path(sys.argv[2])
+        options = parse_search_options(sys.argv[3:])
 
         try:
-            results = search_tasks(query, tasks_file, limit, include_completed)
+            tasks = list_tasks(tasks_file, options["filters"], options["include_completed"], options["limit"])
             output = {
-                "query": query,
-                "total_results": len(results),
+                "filters": options["filters"],
+                "total_results": len(tasks),
                 "results": [
                     {
-                        "option": chr(65 + i),
+                        "option": option_label(i),
                         "task_id": task["id"],
                         "title": task["title"],
                         "status": task["status"],
                         "priority": task["priority"],
-                        "score": int(score),
+                        "category": task["category"],
+                        "epic": task["epic"],
                     }
-                    for i, (task, score) in enumerate(results)
+                    for i, task in enumerate(tasks)
                 ],
-                "table": format_task_table(results),
+                "table": format_task_table([(task, 0) for task in tasks]),
             }
             print(json.dumps(output, indent=2))
         except Exception as e:
             print(json.dumps({"error": str(e)}), file=sys.stderr)
             sys.exit(1)
 
+    elif command == "complete":
+        if len(sys.argv) < 4:
+            print("Usage: task_search.py complete <prefix> <tasks-file> [--limit=5] [--completed]")
+            sys.exit(1)
+
+        text = sys.argv[2]
+        tasks_file = Path(sys.argv[3])
+        options = parse_search_options(sys.argv[4:])
+
+        try:
+            completions, truncated = complete_tasks(text, tasks_file, options["limit"], options["include_completed"])
+            print(json.dumps(format_completion_output(text, completions, truncated), indent=2))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
+    elif command == "search-all":
+        if len(sys.argv) < 4:
+            print("Usage: task_search.py search-all <query> <agent-dir> [--limit=5] [--completed]")
+            sys.exit(1)
+
+        query = sys.argv[2]
+        agent_dir = Path(sys.argv[3])
+        options = parse_search_options(sys.argv[4:])
+
+        try:
+            results, federated = search_federated(query, agent_dir, options["limit"], options["include_completed"])
+            output = format_search_output(query, [(task, score) for task, score, _ in results])
+            for entry, (_, _, source) in zip(output["results"], results):
+                entry["source"] = source
+                entry["source_kind"] = source_kind(source)
+            output["sources"] = len(federated["sources"])
+            output["refreshed_sources"] = federated["refreshed"]
+            print(json.dumps(output, indent=2))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
+    elif command == "search-batch":
+        tasks_file = Path(sys.argv[2])
+        try:
+            for response in search_batch(tasks_file, sys.stdin):
+                print(json.dumps(response), flush=True)
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
+    elif command == "search":
+        if len(sys.argv) < 4:
+            print(
+                "Usage: task_search.py search <query> <tasks-file> [--limit=5] [--completed] [--stream] "
+                "[--rank=relevance|bm25] [--fuzzy] [--page-size=N] [--cursor=...] [--ndjson]"
+            )
+            sys.exit(1)
+
+        query = sys.argv[2]
+        tasks_file = Path(sys.argv[3])
+
+        # Parse options (skip first 4 args: program, search, query, tasks_file)
+        options = parse_search_options(sys.argv[4:])
+        page_size = None
+        cursor = None
+        ndjson = False
+        for arg in sys.argv[4:]:
+            if arg.startswith("--page-size="):
+                page_size = int(arg.split("=", 1)[1])
+            elif arg.startswith("--cursor="):
+                cursor = arg.split("=", 1)[1]
+            elif arg == "--ndjson":
+                ndjson = True
+
+        try:
+            if page_size is None and cursor is None:
+                output = cached_search(query, tasks_file, options)
+            else:
+                del options["limit"]
+                page = search_page(query, tasks_file, page_size, cursor, **options)
+                output = format_search_output(query, page["results"], options["rank"], options["fuzzy"], page["offset"])
+                output.update(offset=page["offset"], total_matches=page["total"], next_cursor=page["next_cursor"])
+
+            if ndjson:
+                write_ndjson(output)
+            else:
+                print(json.dumps(output, indent=2))
+        except Exception as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            sys.exit(1)
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""
+Warm task query service behind the task daemon
+
+Holds parsed tasks, search indexes and a TaskAnalyzer for one tasks file and
+answers task_daemon protocol requests against them. The daemon serves it over
+a Unix socket; task_daemon clients also run it in-process when no daemon is
+listening. Kept apart from task_daemon so the client only imports this (and
+the search and analyzer stack behind it) when it has to answer a request itself.
+"""
+
+import json
+import os
+from pathlib import Path
+import socketserver
+import threading
+from typing import Dict, List, Optional
+
+from markdown_parser import Task
+from task_analyzer import TaskAnalyzer
+from task_cache import load_cached_tasks
+from task_daemon import HAVE_UNIX_SOCKETS
+from task_index import COMPLETION_INDEX_PREFIX, INDEX_LOADERS
+from task_search import (
+    check_search_options,
+    complete_tasks,
+    format_completion_output,
+    format_search_output,
+    parse_search_options,
+    rank_loaded_tasks,
+    search_tasks,
+)
+
+
+class TaskQueryService:
+    """Warm task state for one tasks file, shared by daemon requests and the in-process fallback."""
+
+    def __init__(self, tasks_file: Path) -> None:
+        """
+        Initialize service for a tasks file (nothing is loaded until the first query).
+
+        Args:
+            tasks_file: Path to .agent/tasks.md
+        """
+        self.tasks_file = tasks_file
+        self.tasks: List[Task] = []
+        self._stat: Optional[os.stat_result] = None
+        self._indexes: Dict[str, Dict] = {}
+        self._analyzer: Optional[TaskAnalyzer] = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """
+        Reload tasks if tasks.md changed since the last query.
+
+        Returns:
+            True if tasks were (re)loaded
+
+        Raises:
+            FileNotFoundError: If tasks file doesn't exist
+        """
+        stat = self.tasks_file.stat()
+        if self._stat is not None and (stat.st_size, stat.st_mtime_ns) == (self._stat.st_size, self._stat.st_mtime_ns):
+            return False
+
+        self.tasks = load_cached_tasks(self.tasks_file)
+        self._stat = stat
+        self._indexes = {}
+        self._analyzer = None
+        return True
+
+    def load_index(self, kind: str) -> Dict:
+        """Return a search index for the current tasks, loading it on first use."""
+        index = self._indexes.get(kind)
+        if index is None:
+            index = self._indexes[kind] = INDEX_LOADERS[kind](self.tasks_file, self.tasks, self._stat)
+        return index
+
+    def search(self, query: str, **options) -> Dict:
+        """
+        Run a search against the warm tasks (see task_search.search_tasks for options).
+
+        Returns:
+            Search response as produced by task_search.format_search_output
+        """
+        options = {**parse_search_options([]), **options}
+        check_search_options(options["stream"], options["rank"], options["fuzzy"])
+
+        if options["stream"]:
+            # Streaming exists to avoid holding tasks in memory; honour it by reading the file
+            results = search_tasks(query, self.tasks_file, **options)
+        else:
+            self.refresh()
+            if not self.tasks and not self.tasks_file.read_text().strip():
+                raise ValueError("Tasks file is empty")
+
+            results = rank_loaded_tasks(
+                self.tasks,
+                self.load_index,
+                query,
+                options["limit"],
+                options["include_completed"],
+                options["rank"],
+                options["fuzzy"],
+                options["filters"],
+            )
+
+        return format_search_output(query, results, options["rank"], options["fuzzy"])
+
+    def complete(self, prefix: str, limit: int = 5, include_completed: bool = False) -> Dict:
+        """
+        Complete a typed prefix against the warm completion index.
+
+        Returns:
+            Completion response as produced by task_search.format_completion_output
+        """
+        self.refresh()
+        completions, truncated = complete_tasks(
+            prefix, self.tasks_file, limit, include_completed, self.load_index(COMPLETION_INDEX_PREFIX)
+        )
+        return format_completion_output(prefix, completions, truncated)
+
+    def analyze(self, user_input: str) -> Dict:
+        """
+        Analyze a task description with a TaskAnalyzer built over the warm tasks.
+
+        Returns:
+            TaskAnalyzer.analyze result
+        """
+        self.refresh()
+        if self._analyzer is None:
+            self._analyzer = TaskAnalyzer(self.tasks, tasks_file=self.tasks_file, stat=self._stat)
+        return self._analyzer.analyze(user_input)
+
+    def handle(self, request: Dict) -> Dict:
+        """
+        Execute one protocol request.
+
+        Search and complete options come from "args" (task_search.py CLI flags,
+        parsed here so clients need not import the search stack) and/or explicit
+        option keys, which take precedence.
+
+        Args:
+            request: Request dict with a "command" key
+
+        Returns:
+            Response dict ({"ok": True, "result": ...} or {"ok": False, "error": ...})
+        """
+        command = request.get("command")
+
+        try:
+            with self._lock:
+                if command == "search":
+                    options = parse_search_options(request.get("args", []))
+                    options.update((key, request[key]) for key in list(options) if key in request)
+                    result = self.search(request.get("query", ""), **options)
+                elif command == "analyze":
+                    result = self.analyze(request.get("input", ""))
+                elif command == "complete":
+                    options = parse_search_options(request.get("args", []))
+                    result = self.complete(
+                        request.get("prefix", ""),
+                        request.get("limit", options["limit"]),
+                        request.get("include_completed", options["include_completed"]),
+                    )
+                elif command == "ping":
+                    result = {"tasks_file": str(self.tasks_file), "pid": os.getpid(), "tasks": len(self.tasks)}
+                else:
+                    return {"ok": False, "error": f"Unknown command: {command}"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+        return {"ok": True, "result": result}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads newline-delimited JSON requests and writes one JSON response per request."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"ok": False, "error": f"Invalid request: {e}"}
+            else:
+                if request.get("command") == "stop":
+                    self._respond({"ok": True, "result": "stopping"})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                response = self.server.service.handle(request)
+
+            self._respond(response)
+
+    def _respond(self, response: Dict) -> None:
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+if HAVE_UNIX_SOCKETS:
+
+    class TaskDaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Threaded Unix socket server holding a TaskQueryService."""
+
+        daemon_threads = True
+
+        def __init__(self, socket_path: Path, service: TaskQueryService) -> None:
+            self.service = service
+            super().__init__(str(socket_path), _RequestHandler)
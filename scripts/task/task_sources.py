@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+"""
+Multi-source task loading across the .agent tree
+
+Combines every task file the task commands produce into one deduplicated task set:
+- .agent/tasks.md (active tasks)
+- .agent/tasks-archive.md (archived tasks)
+- .agent/Session-*/TASK-*--*/task.md (per-session copies made by copy_task_to_session)
+
+Files are discovered with os.scandir and parsed in a process pool once there is
+enough to parse (PARALLEL_MIN_BYTES), otherwise in-process. When the same task ID
+appears in several files, the copy from the most recently modified file wins.
+
+For federated search, load_federated_index keeps one combined index over all
+sources (.agent/.cache/federated): per source file, its parsed records and token
+postings, stamped with size and mtime so only changed files are re-parsed.
+"""
+
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from markdown_parser import Task
+from task_cache import CACHE_DIR_NAME, is_fresh, load_task_records, parse_task_file, read_cache, write_cache
+from task_index import build_search_index
+
+
+ROOT_TASK_FILES = ("tasks.md", "tasks-archive.md")
+SESSION_DIR_PREFIX = "Session-"
+SESSION_TASK_DIR_PREFIX = "TASK-"
+SESSION_TASK_FILE = "task.md"
+FEDERATED_INDEX_NAME = "federated"
+SOURCE_KINDS = {"tasks.md": "active", "tasks-archive.md": "archive"}
+# Total task file size below which parsing stays in-process (pool startup and
+# pickling results back cost more than parsing ~1 MiB of markdown)
+PARALLEL_MIN_BYTES = 1 << 20
+
+
+def discover_task_files(agent_dir: Path) -> List[Path]:
+    """
+    Find all task markdown files under an .agent directory.
+
+    Args:
+        agent_dir: Path to .agent directory
+
+    Returns:
+        Paths in discovery order: root task files first, then session task.md files
+    """
+    root_files = []
+    session_files = []
+
+    if not agent_dir.is_dir():
+        return []
+
+    with os.scandir(agent_dir) as entries:
+        for entry in entries:
+            if entry.name in ROOT_TASK_FILES and entry.is_file():
+                root_files.append(Path(entry.path))
+            elif entry.name.startswith(SESSION_DIR_PREFIX) and entry.is_dir():
+                session_files.extend(_discover_session_task_files(entry.path))
+
+    root_files.sort(key=lambda path: ROOT_TASK_FILES.index(path.name))
+    session_files.sort()
+    return root_files + session_files
+
+
+def _discover_session_task_files(session_dir: str) -> List[Path]:
+    """Find TASK-*/task.md files directly inside one session directory."""
+    task_files = []
+    with os.scandir(session_dir) as entries:
+        for entry in entries:
+            if entry.name.upper().startswith(SESSION_TASK_DIR_PREFIX) and entry.is_dir():
+                task_file = Path(entry.path) / SESSION_TASK_FILE
+                if task_file.is_file():
+                    task_files.append(task_file)
+    return task_files
+
+
+def _load_source(path_str: str, use_cache: bool) -> Tuple[str, int, List[Tuple], float]:
+    """Parse one task file (process pool worker).
+
+    Returns:
+        (path, mtime_ns, records, parse_seconds)
+    """
+    path = Path(path_str)
+    started = time.perf_counter()
+    mtime_ns = path.stat().st_mtime_ns
+    records = load_task_records(path) if use_cache else parse_task_file(path)
+    return path_str, mtime_ns, records, time.perf_counter() - started
+
+
+def load_task_sources(agent_dir: Path, max_workers: Optional[int] = None) -> Dict:
+    """
+    Load and merge tasks from every task file under an .agent directory.
+
+    Root files (tasks.md, tasks-archive.md) go through the parsed-task cache;
+    session task.md files are small and parsed directly so no cache directories
+    are created inside session folders.
+
+    Args:
+        agent_dir: Path to .agent directory
+        max_workers: Process pool size (None = CPU count, 1 = parse in-process); the
+            pool is only started for more than one file totalling PARALLEL_MIN_BYTES
+
+    Returns:
+        Dict with:
+        - tasks: deduplicated List[Task] in first-seen order
+        - sources: Dict mapping task ID → file the winning copy came from
+        - files: per-file report (file, tasks, mtime_ns, parse_seconds)
+        - duplicates: number of task copies dropped in favor of a newer file
+    """
+    files = discover_task_files(agent_dir)
+    jobs = [(str(path), path.parent == agent_dir) for path in files]
+
+    if len(jobs) > 1 and max_workers != 1 and sum(path.stat().st_size for path in files) >= PARALLEL_MIN_BYTES:
+        # Imported here: only large trees pay for concurrent.futures and multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_load_source, *zip(*jobs)))
+    else:
+        results = [_load_source(path_str, use_cache) for path_str, use_cache in jobs]
+
+    winners: Dict[str, Tuple[int, Tuple, str]] = {}
+    duplicates = 0
+    report = []
+
+    for path_str, mtime_ns, records, elapsed in results:
+        report.append({"file": path_str, "tasks": len(records), "mtime_ns": mtime_ns, "parse_seconds": elapsed})
+        for record in records:
+            task_id = record[0]
+            current = winners.get(task_id)
+            if current is not None:
+                duplicates += 1
+                if current[0] >= mtime_ns:
+                    continue
+            winners[task_id] = (mtime_ns, record, path_str)
+
+    return {
+        "tasks": [Task.from_record(record) for _, record, _ in winners.values()],
+        "sources": {task_id: path_str for task_id, (_, _, path_str) in winners.items()},
+        "files": report,
+        "duplicates": duplicates,
+    }
+
+
+def source_kind(source: str) -> str:
+    """Classify a source path relative to .agent as "active", "archive" or "session"."""
+    return SOURCE_KINDS.get(source, "session")
+
+
+def load_federated_index(agent_dir: Path) -> Dict:
+    """
+    Load the combined search index over every task file under an .agent directory.
+
+    Each source is refreshed independently: files whose size and mtime match the
+    cached segment are reused as-is, changed or new files are re-parsed, and
+    segments for deleted files are dropped.
+
+    Args:
+        agent_dir: Path to .agent directory
+
+    Returns:
+        Dict with:
+        - sources: source path relative to agent_dir → segment dict with records
+          (markdown_parser.parse_task_record tuples) and postings (task_index
+          token postings over those records), in discovery order
+        - refreshed: number of sources re-parsed for this call
+    """
+    cache_path = agent_dir / CACHE_DIR_NAME / FEDERATED_INDEX_NAME
+    entry = read_cache(cache_path) or {}
+    previous = entry.get("sources", {})
+
+    sources = {}
+    refreshed = 0
+
+    for path in discover_task_files(agent_dir):
+        source = path.relative_to(agent_dir).as_posix()
+        stat = path.stat()
+        segment = previous.get(source)
+
+        if not is_fresh(segment, stat):
+            records = parse_task_file(path)
+            segment = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "records": records,
+                "postings": build_search_index(Task.from_record(record) for record in records)["postings"],
+            }
+            refreshed += 1
+
+        sources[source] = segment
+
+    if refreshed or sources.keys() != previous.keys():
+        write_cache(cache_path, {"sources": sources})
+
+    return {"sources": sources, "refreshed": refreshed}
+
+
+def main() -> None:
+    """CLI interface: summarize merged tasks and per-file parse timing."""
+    if len(sys.argv) < 2:
+        print("Usage: task_sources.py <agent-dir> [--workers=N]")
+        sys.exit(1)
+
+    agent_dir = Path(sys.argv[1].replace("~", str(Path.home())))
+    max_workers = None
+
+    for arg in sys.argv[2:]:
+        if arg.startswith("--workers="):
+            max_workers = int(arg.split("=")[1])
+
+    try:
+        started = time.perf_counter()
+        result = load_task_sources(agent_dir, max_workers)
+        output = {
+            "total_tasks": len(result["tasks"]),
+            "duplicates": result["duplicates"],
+            "total_seconds": time.perf_counter() - started,
+            "files": result["files"],
+        }
+        print(json.dumps(output, indent=2))
+    except Exception as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
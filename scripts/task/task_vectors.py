@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Optional NumPy backend for scoring very large backlogs
+
+Tasks are encoded as a sparse task × term incidence matrix (one entry per
+distinct term of a task, stored as parallel row/term arrays) so a query is
+scored with a few array operations instead of a Python loop per task, and the
+best rows are selected with argpartition rather than a full sort.
+
+Callers keep their pure-Python path and only use this module when NumPy is
+installed (HAVE_NUMPY) and the backlog is large enough to pay for it
+(TaskSearchConfig.VECTOR_MIN_TASKS). Rankings are identical either way:
+ties resolve in task order, like the stable sorts they replace.
+
+NumPy itself is imported inside the vector code paths only, so small backlogs
+never pay its import time; HAVE_NUMPY is a module lookup, not an import.
+"""
+
+from array import array
+from bisect import bisect_right
+import importlib.util
+from typing import Dict, Iterable, List
+
+from config import TaskSearchConfig
+
+
+# Optional: every caller falls back to pure Python
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Separates vocabulary terms in the joined lookup string (never part of a term)
+TERM_SEPARATOR = "\n"
+
+
+def use_vectors(task_count: int) -> bool:
+    """Check whether the NumPy backend is available and worth using for task_count tasks."""
+    return HAVE_NUMPY and task_count >= TaskSearchConfig.VECTOR_MIN_TASKS
+
+
+def encode_incidence(term_sets: Iterable[Iterable[str]]) -> Dict:
+    """
+    Encode per-task terms as a sparse incidence matrix (pure Python, marshal-friendly).
+
+    Args:
+        term_sets: Terms of each task in row order (duplicates are ignored)
+
+    Returns:
+        Dict with "count" (rows), "vocab" (terms by id) and "rows"/"terms"
+        (native int arrays as bytes, one pair per task-term entry)
+    """
+    term_ids: Dict[str, int] = {}
+    rows = array("i")
+    terms = array("i")
+    count = 0
+
+    for row, term_set in enumerate(term_sets):
+        for term in set(term_set):
+            term_id = term_ids.setdefault(term, len(term_ids))
+            rows.append(row)
+            terms.append(term_id)
+        count = row + 1
+
+    return {"count": count, "vocab": list(term_ids), "rows": rows.tobytes(), "terms": terms.tobytes()}
+
+
+class IncidenceMatrix:
+    """Read-only task × term incidence matrix over NumPy arrays (requires HAVE_NUMPY)."""
+
+    def __init__(self, encoded: Dict) -> None:
+        """
+        Wrap an encoded matrix without copying its entry arrays.
+
+        Args:
+            encoded: Dict from encode_incidence
+        """
+        import numpy as np
+
+        self.count = encoded["count"]
+        self.vocab: List[str] = encoded["vocab"]
+        self.rows = np.frombuffer(encoded["rows"], dtype=np.intc)
+        self.terms = np.frombuffer(encoded["terms"], dtype=np.intc)
+        self._term_ids: Dict[str, int] = {}
+        self._joined = ""
+        self._starts: List[int] = []
+
+    def row_sizes(self):
+        """Return the number of distinct terms per row."""
+        import numpy as np
+
+        return np.bincount(self.rows, minlength=self.count)
+
+    def rows_with_terms(self, term_mask):
+        """Return a per-row bool array: True where the row has any term set in term_mask."""
+        import numpy as np
+
+        hits = np.zeros(self.count, dtype=bool)
+        hits[self.rows[term_mask[self.terms]]] = True
+        return hits
+
+    def rows_containing(self, word: str):
+        """
+        Return a per-row bool array: True where some term contains word as a substring.
+
+        Terms are located with str.find over the joined vocabulary, so the
+        per-term work happens in C rather than a Python loop.
+        """
+        import numpy as np
+
+        if not self._starts:
+            self._joined = TERM_SEPARATOR.join(self.vocab)
+            position = 0
+            for term in self.vocab:
+                self._starts.append(position)
+                position += len(term) + 1
+
+        term_mask = np.zeros(len(self.vocab), dtype=bool)
+        position = self._joined.find(word)
+        while position >= 0:
+            term_id = bisect_right(self._starts, position) - 1
+            term_mask[term_id] = True
+            next_term = term_id + 1
+            if next_term >= len(self._starts):
+                break
+            position = self._joined.find(word, self._starts[next_term])
+
+        return self.rows_with_terms(term_mask)
+
+    def shared_term_counts(self, terms: Iterable[str]):
+        """Return per-row counts of distinct terms shared with terms (exact term matches)."""
+        import numpy as np
+
+        if not self._term_ids:
+            self._term_ids = {term: term_id for term_id, term in enumerate(self.vocab)}
+
+        term_mask = np.zeros(len(self.vocab), dtype=bool)
+        for term in set(terms):
+            term_id = self._term_ids.get(term)
+            if term_id is not None:
+                term_mask[term_id] = True
+
+        return np.bincount(self.rows[term_mask[self.terms]], minlength=self.count)
+
+
+def top_positions(scores, rows, limit: int = 0):
+    """
+    Order rows by score descending, ties by row ascending (a stable sort), keeping the first limit.
+
+    argpartition finds the limit-th best score without sorting every row; rows tied
+    with it are all kept so tie order matches the full stable sort exactly.
+
+    Args:
+        scores: Per-row scores (NumPy array indexed by row)
+        rows: Candidate rows in ascending order (NumPy int array)
+        limit: Number of rows to return (0 = all)
+
+    Returns:
+        NumPy array of rows in rank order
+    """
+    import numpy as np
+
+    values = scores[rows]
+
+    if 0 < limit < len(rows):
+        cutoff = values[np.argpartition(-values, limit - 1)[:limit]].min()
+        keep = values >= cutoff
+        rows, values = rows[keep], values[keep]
+
+    ranked = rows[np.lexsort((rows, -values))]
+    return ranked[:limit] if limit > 0 else ranked